@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Words that end in a period without ending a sentence.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Words that end in a period without ending a sentence.
+
+The abbreviations of a language are kept in a trie of their characters in
+reverse, so the word before a period can be checked by walking back from
+it one character at a time.
+
+"""
+
+from string import ascii_uppercase, digits
+from threading import RLock
+
+# The abbreviations of each language in lower case without the final
+# period.  They also match capitalized or in upper case, and single capital
+# letters, for initials, are added to every language.
+_abbreviations = {
+    'en': '''mr mrs ms dr prof rev hon gen col capt lt sgt st mt ft jr sr
+             vs cf e.g i.e viz al approx dept fig vol pp jan feb apr jun jul
+             aug sep sept oct nov dec''',
+    'de': '''hr fr dr prof nr str z.b d.h u.a bzw ca vgl ggf evtl sog inkl
+             zzgl bspw''',
+    'es': '''sr sra srta dr dra ud uds p.ej aprox pág''',
+    'fr': '''mme mlle dr pr p.ex cf env''',
+}
+
+# Languages where a number followed by a period is an ordinal.
+_ordinal_languages = {'cs', 'da', 'de', 'fi', 'hu', 'no', 'pl', 'sk', 'sl'}
+
+# Marks the end of a word in the trie.
+_END = ''
+
+# Opening quotes and brackets that can come before a word.
+_OPENERS = '"\'([{\u00ab\u201c\u2018'
+
+# The tries already built and the lock protecting them.
+_tries = {}
+_tries_lock = RLock()
+
+
+def _build_trie(language: str) -> dict:
+    """ Returns the trie of the abbreviations of language.
+
+    """
+
+    trie = {}
+
+    words = set(ascii_uppercase)
+    for word in _abbreviations.get(language, '').split():
+        words.update((word, word.capitalize(), word.upper()))
+
+    for word in words:
+        node = trie
+        for char in reversed(word):
+            node = node.setdefault(char, {})
+        node[_END] = True
+
+    if language in _ordinal_languages:
+        # Any run of digits, the node loops back to itself.
+        number = {_END: True}
+        for char in digits:
+            trie[char] = number
+            number[char] = number
+
+    return trie
+
+
+def get_abbreviations(language: str='en') -> dict:
+    """ get_abbreviations(language='en') -> Returns the trie of the
+    abbreviations of language, such as 'en' or 'en-us', building it the
+    first time.
+
+    """
+
+    language = language.lower().split('-')[0]
+
+    with _tries_lock:
+        if language not in _tries:
+            _tries[language] = _build_trie(language)
+
+        return _tries[language]
+
+
+def is_abbreviation(text: str, end: int, trie: dict) -> bool:
+    """ is_abbreviation(text, end, trie) -> True if the word that ends at
+    offset end in text is in trie, a trie from get_abbreviations.
+
+    """
+
+    node = trie
+    index = end - 1
+
+    # Walk back to the start of the word.
+    while index >= 0:
+        char = text[index]
+        if char.isspace() or char in _OPENERS:
+            break
+
+        node = node.get(char)
+        if node is None:
+            return False
+
+        index -= 1
+
+    return index < end - 1 and _END in node
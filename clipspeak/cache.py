@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# A cache of synthesised audio.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" A cache of synthesised audio keyed by a hash of the text and the
+settings used to synthesise it.
+
+"""
+
+from collections import OrderedDict
+from hashlib import sha1
+from threading import RLock
+import os
+
+# The process wide caches of whole texts and of single sentences.
+_cache = None
+_phrase_cache = None
+_cache_lock = RLock()
+
+
+def get_cache(cache_dir: str=None):
+    """ get_cache(cache_dir=None) -> Returns the process wide audio cache.
+    If cache_dir is given the cache also stores audio there.
+
+    """
+
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = AudioCache()
+        if cache_dir:
+            _cache.cache_dir = cache_dir
+
+        return _cache
+
+
+def get_phrase_cache(cache_dir: str=None):
+    """ get_phrase_cache(cache_dir=None) -> Returns the process wide cache
+    of single sentences.  If cache_dir is given the cache also stores audio
+    in its 'phrases' sub directory.
+
+    """
+
+    global _phrase_cache
+
+    with _cache_lock:
+        if _phrase_cache is None:
+            _phrase_cache = AudioCache(max_bytes=32 << 20,
+                                       max_disk_bytes=128 << 20)
+        if cache_dir:
+            _phrase_cache.cache_dir = os.path.join(cache_dir, 'phrases')
+
+        return _phrase_cache
+
+
+def cache_stats() -> dict:
+    """ cache_stats() -> Returns the stats of the process wide caches as
+    {'text': stats, 'phrase': stats}, where the stats of a cache that was
+    never used are empty.
+
+    """
+
+    with _cache_lock:
+        return {
+            'text': _cache.stats() if _cache is not None else {},
+            'phrase': (_phrase_cache.stats() if _phrase_cache is not None
+                       else {}),
+        }
+
+
+class AudioCache(object):
+    """ An LRU cache of PCM data with a memory tier and an optional disk
+    tier.
+
+    """
+
+    def __init__(self, max_bytes: int=64 << 20, cache_dir: str=None,
+                 max_disk_bytes: int=512 << 20):
+        """ AudioCache(max_bytes=64MiB, cache_dir=None, max_disk_bytes=512MiB)
+        -> Keep up to max_bytes of audio in memory and, if cache_dir is
+        given, up to max_disk_bytes in files in cache_dir.
+
+        """
+
+        self._lock = RLock()
+
+        self._max_bytes = max_bytes
+        self._max_disk_bytes = max_disk_bytes
+
+        # Least recently used first.
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk = OrderedDict()
+        self._disk_bytes = 0
+
+        self._cache_dir = None
+        self.cache_dir = cache_dir
+
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "max_bytes=%s, cache_dir=%r, max_disk_bytes=%s" % (
+            self._max_bytes, self._cache_dir, self._max_disk_bytes)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def __len__(self) -> int:
+        """ The number of entries in memory.
+
+        """
+
+        return len(self._memory)
+
+    def __contains__(self, key: str) -> bool:
+        """ True if key is in either tier.
+
+        """
+
+        return key in self._memory or key in self._disk
+
+    @staticmethod
+    def key(text: str, **params) -> str:
+        """ key(text, **params) -> Returns the cache key for text
+        synthesised with params (voice, speed, pitch, volume, range and
+        the espeak version).  Runs of whitespace in text are ignored.
+
+        """
+
+        text = ' '.join(text.split())
+        settings = ','.join('%s=%s' % (k, params[k]) for k in sorted(params))
+
+        return sha1(('%s\0%s' % (settings, text)).encode()).hexdigest()
+
+    @property
+    def cache_dir(self) -> str:
+        """ The directory of the disk tier or None.
+
+        """
+
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, value: str):
+        """ Set the directory of the disk tier and index what is in it.
+
+        """
+
+        with self._lock:
+            if value == self._cache_dir:
+                return
+
+            self._cache_dir = value
+            self._disk.clear()
+            self._disk_bytes = 0
+
+            if not value:
+                return
+
+            os.makedirs(value, exist_ok=True)
+
+            # Index the existing entries oldest first, counting the size
+            # of their event index files too.
+            times = {}
+            sizes = {}
+            for entry in os.scandir(value):
+                key, extension = os.path.splitext(entry.name)
+                if extension in ('.pcm', '.idx') and entry.is_file():
+                    stat = entry.stat()
+                    sizes[key] = sizes.get(key, 0) + stat.st_size
+                    if extension == '.pcm':
+                        times[key] = stat.st_mtime
+            entries = [(times[key], key, sizes[key]) for key in times]
+            for _, key, size in sorted(entries):
+                self._disk[key] = size
+                self._disk_bytes += size
+
+            self._evict()
+
+    def _path(self, key: str, extension: str='.pcm') -> str:
+        """ Returns the path of the file for key.
+
+        """
+
+        return os.path.join(self._cache_dir, key + extension)
+
+    def fits(self, size: int) -> bool:
+        """ fits(size) -> True if size bytes of audio can be kept in either
+        tier.
+
+        """
+
+        limit = self._max_bytes
+        if self._cache_dir:
+            limit = max(limit, self._max_disk_bytes)
+
+        return size <= limit
+
+    def get(self, key: str) -> bytes:
+        """ get(key) -> Returns the audio stored for key or None.
+
+        """
+
+        with self._lock:
+            entry = self._memory.get(key, None)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+
+            if key in self._disk:
+                try:
+                    with open(self._path(key), 'rb') as cache_file:
+                        data = cache_file.read()
+                    os.utime(self._path(key))
+                    index = b''
+                    if os.path.exists(self._path(key, '.idx')):
+                        with open(self._path(key, '.idx'), 'rb') as idx_file:
+                            index = idx_file.read()
+                except OSError:
+                    self._drop_file(key)
+                else:
+                    self._disk.move_to_end(key)
+                    self._hits += 1
+                    self._disk_hits += 1
+
+                    # Keep it in memory for next time.
+                    self._store(key, data, index)
+                    return data
+
+            self._misses += 1
+            return None
+
+    def get_index(self, key: str) -> bytes:
+        """ get_index(key) -> Returns the event index stored with the audio
+        of key, after a successful get, or b''.
+
+        """
+
+        with self._lock:
+            entry = self._memory.get(key, None)
+
+            return entry[1] if entry is not None else b''
+
+    def put(self, key: str, data: bytes, index: bytes=b''):
+        """ put(key, data, index=b'') -> Store data and its packed event
+        index for key in both tiers.
+
+        """
+
+        data = bytes(data)
+
+        with self._lock:
+            self._store(key, data, index)
+
+            if self._cache_dir and key not in self._disk:
+                # Write to temporary files first so other processes never
+                # see a partial entry.
+                try:
+                    for extension, value in (('.idx', index), ('.pcm', data)):
+                        path = self._path(key, extension)
+                        temp_path = '%s.%s.tmp' % (path, os.getpid())
+                        with open(temp_path, 'wb') as cache_file:
+                            cache_file.write(value)
+                        os.replace(temp_path, path)
+                except OSError:
+                    return
+
+                self._disk[key] = len(data) + len(index)
+                self._disk_bytes += len(data) + len(index)
+
+            self._evict()
+
+    def _store(self, key: str, data: bytes, index: bytes):
+        """ Put data and index in the memory tier.
+
+        """
+
+        size = len(data) + len(index)
+        if size > self._max_bytes:
+            return
+
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old[0]) + len(old[1])
+
+        self._memory[key] = (data, index)
+        self._memory_bytes += size
+
+        self._evict()
+
+    def _drop_file(self, key: str):
+        """ Remove the files for key from the disk tier.
+
+        """
+
+        self._disk_bytes -= self._disk.pop(key, 0)
+        for extension in ('.pcm', '.idx'):
+            try:
+                os.remove(self._path(key, extension))
+            except OSError:
+                pass
+
+    def _evict(self):
+        """ Remove the least recently used entries until both tiers fit.
+
+        """
+
+        while self._memory_bytes > self._max_bytes:
+            _, (data, index) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(data) + len(index)
+            self._evictions += 1
+
+        while self._disk and self._disk_bytes > self._max_disk_bytes:
+            self._drop_file(next(iter(self._disk)))
+            self._evictions += 1
+
+    def clear(self):
+        """ Empty the memory tier.
+
+        """
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def stats(self) -> dict:
+        """ stats() -> Returns the hit, miss, eviction and size counters.
+
+        """
+
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+            }
@@ -40,8 +40,9 @@ class ClipSpeak(object):
 
     """
 
-    def __init__(self):
-        """ Initialize stuff.
+    def __init__(self, sink: str='alsa'):
+        """ ClipSpeak(sink='alsa') -> Read the clipboard to the sink named
+        by sink.
 
         """
 
@@ -55,7 +56,7 @@ class ClipSpeak(object):
         self._clipboard = ProcessClipboard(self._get_text)
 
         # Create reader object.
-        self._reader = Reader()
+        self._reader = Reader(sink=sink)
 
         # Create the trayicon
         self._trayicon = TrayIcon("face-monkey", self._clicked)
@@ -136,12 +137,13 @@ class ClipSpeak(object):
 
         """
 
-        self._reader.stop()
+        # Do not wait for the player so the menu does not stall.
+        self._reader.stop(wait=False)
 
     def _exit(self, *args):
         """ Callback for a gtk menuitem.
 
         """
 
-        self._stop()
+        self._reader.close()
         self._trayicon.exit()
@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Text read from a memory mapped file.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Text read from a memory mapped file.
+
+The file is decoded a block at a time as the text is needed and nothing
+decoded is kept.  The character and byte offsets where the blocks start are
+kept instead, so any part of the text can be decoded again from the block
+that holds it.
+
+"""
+
+from array import array
+from bisect import bisect_right
+from sys import maxsize as sys_maxsize
+from threading import Lock
+import codecs
+import mmap
+import os
+
+
+class Document(object):
+    """ The text of a file, decoded from a memory mapping of it as it is
+    read.  It can be given to Text, EspeakText and Reader.read in place of a
+    str, and is iterated over in blocks of text.
+
+    """
+
+    def __init__(self, path: str, encoding: str='utf-8',
+                 errors: str='replace', block_size: int=1 << 16):
+        """ Document(path, encoding='utf-8', errors='replace',
+        block_size=64KiB) -> The text of the file at path, decoded with
+        encoding block_size bytes at a time.
+
+        """
+
+        self._path = path
+        self._encoding = encoding
+        self._errors = errors
+        # A block has to be longer than a character or decoding never
+        # gets past it.
+        self._block_size = max(block_size, 16)
+
+        # The character and byte offsets and decoder flags where each block
+        # decoded so far starts.  The first block starts with the flags of a
+        # new decoder, so a byte order mark is still looked for and
+        # dropped.
+        decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self._chars = array('Q', [0])
+        self._bytes = array('Q', [0])
+        self._flags = array('q', [decoder.getstate()[1]])
+
+        # The number of characters, once all of it was decoded.
+        self._length = None
+
+        self._open()
+
+    def _open(self):
+        """ Map the file.
+
+        """
+
+        with open(self._path, 'rb') as file:
+            self._size = os.fstat(file.fileno()).st_size
+
+            # An empty file can not be mapped.
+            self._map = None
+            if self._size:
+                self._map = mmap.mmap(file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+
+        # Blocks may be decoded by more than one thread.
+        self._lock = Lock()
+        self.closed = False
+
+    def __getstate__(self) -> dict:
+        """ Pickle everything except the mapping and lock, so the file is
+        mapped again instead of being copied to another process.
+
+        """
+
+        state = self.__dict__.copy()
+        del state['_map'], state['_lock']
+
+        return state
+
+    def __setstate__(self, state: dict):
+        """ Map the file in the new process.
+
+        """
+
+        self.__dict__.update(state)
+        self._open()
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "path=%r, encoding=%r" % (self._path, self._encoding)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def __enter__(self):
+        """ Provides the ability to use pythons with statement.
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Unmap the file when finished.
+
+        """
+
+        self.close()
+        return not bool(exc_type)
+
+    @property
+    def path(self) -> str:
+        """ The path of the file.
+
+        """
+
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """ The size of the file in bytes.
+
+        """
+
+        return self._size
+
+    def _blocks(self, number: int=0):
+        """ Generate the text of the blocks from block number on, and note
+        where each one starts.
+
+        """
+
+        decoder = codecs.getincrementaldecoder(self._encoding)(self._errors)
+
+        chars = self._chars[number]
+        start = self._bytes[number]
+        flags = self._flags[number]
+
+        while start < self._size and not self.closed:
+            end = min(start + self._block_size, self._size)
+
+            # Every block starts at a character, so decoding can start from
+            # any of them.
+            decoder.setstate((b'', flags))
+            text = decoder.decode(self._map[start:end], end == self._size)
+            pending, flags = decoder.getstate()
+
+            # The pages are still in the page cache, but no longer count
+            # against this process.
+            self._forget(start, end)
+
+            chars += len(text)
+            start = end - len(pending)
+            number += 1
+            with self._lock:
+                if number == len(self._chars) and start < self._size:
+                    self._chars.append(chars)
+                    self._bytes.append(start)
+                    self._flags.append(flags)
+
+            yield text
+
+        if start >= self._size:
+            self._length = chars
+
+    def _forget(self, start: int, end: int):
+        """ Drop the pages from start to end of the file from the mapping,
+        if the platform can.
+
+        """
+
+        if hasattr(mmap, 'MADV_DONTNEED'):
+            start -= start % mmap.PAGESIZE
+            self._map.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+    def __iter__(self):
+        """ Iterate over the text a block at a time.
+
+        """
+
+        return self._blocks()
+
+    def chunks(self, start: int=0):
+        """ chunks(start=0) -> Generate the text from character offset start
+        on a block at a time, decoding from the block that holds it.
+
+        """
+
+        number = bisect_right(self._chars, start) - 1
+        offset = self._chars[number]
+        for text in self._blocks(number):
+            if offset + len(text) > start:
+                yield text[max(start - offset, 0):]
+
+            offset += len(text)
+
+    def __len__(self) -> int:
+        """ The number of characters, the first time this decodes the rest of
+        the file.
+
+        """
+
+        if self._length is None:
+            for _ in self._blocks(len(self._chars) - 1):
+                pass
+
+        return self._length
+
+    def __getitem__(self, key) -> str:
+        """ Returns the character at an offset, or the text of a slice, only
+        decoding the blocks that hold it.
+
+        """
+
+        if isinstance(key, slice):
+            start, stop, step = key.start, key.stop, key.step
+        else:
+            start, stop, step = key, key + 1 if key != -1 else None, None
+
+        start = 0 if start is None else start
+        stop = sys_maxsize if stop is None else stop
+        if start < 0 or stop < 0:
+            start, stop, _ = slice(start, stop).indices(len(self))
+
+        parts = []
+        if start < stop:
+            offset = start
+            for text in self.chunks(start):
+                parts.append(text[:stop - offset])
+
+                offset += len(text)
+                if offset >= stop:
+                    break
+
+        text = ''.join(parts)
+        if not text and not isinstance(key, slice):
+            raise IndexError("document index out of range")
+
+        return text if step is None else text[::step]
+
+    def close(self):
+        """ Unmap the file.
+
+        """
+
+        if not self.closed:
+            self.closed = True
+            if self._map is not None:
+                self._map.close()
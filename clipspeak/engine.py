@@ -0,0 +1,442 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# A process wide espeak synthesis engine.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" A process wide espeak synthesis engine.
+
+libespeak has a single global state and synth callback, so it is
+initialized once per process and every synthesis request goes through one
+queue and one thread.
+
+"""
+
+from collections import deque
+from itertools import chain
+from os import getpid
+from sys import stderr as sys_stderr
+from threading import Thread, RLock, Condition
+import atexit
+
+from musio.import_util import LazyImport
+
+_espeak = LazyImport('espeak._espeak', globals(), locals(), ['_espeak'], 1)
+
+# The engine for this process and the lock protecting its creation.
+_engine = None
+_engine_lock = RLock()
+
+# What a job did with its turn: finished, gave up the engine until it is
+# woken, or made way for a woken job.
+_DONE, _WAITING, _READY = range(3)
+
+
+def err_check(ret_val):
+    """ Checks the 'ret_val' for error status (<0) and prints and error
+    message.  Returns 'ret_val' for the calling function to use.
+
+    """
+
+    try:
+        assert(ret_val >= 0)
+    except Exception as err:
+        print("There was and error %s %s" % (err, ret_val),
+              file=sys_stderr)
+
+    return ret_val
+
+
+def get_engine():
+    """ get_engine() -> Returns the engine for this process, creating it
+    the first time.
+
+    """
+
+    global _engine
+
+    with _engine_lock:
+        # A forked child does not get the parent's synthesis thread, so
+        # it needs its own engine.
+        if not _engine or _engine.pid != getpid():
+            _engine = SpeechEngine()
+
+        return _engine
+
+
+class SynthJob(object):
+    """ A request to synthesise a sequence of sentences.
+
+    """
+
+    def __init__(self, sentences, params: dict, callback, finished=None,
+                 cache_key: str=None):
+        """ SynthJob(sentences, params, callback, finished=None,
+        cache_key=None) -> Job
+        that synthesises each string in sentences using the settings in
+        params (voice, speed, pitch, volume and range).  The params are
+        checked before every sentence so changes apply to the next one.
+
+        callback(wav, numsamples, events) receives the audio and returns
+        0 to continue or 1 to abort, and finished() is called once the job
+        is done.  cache_key is the key the caller stores the audio under.
+
+        sentences may yield None instead of a string to give up the engine
+        to other jobs until SpeechEngine.wake is called, instead of
+        blocking it.  Jobs with the same callback run in order.
+
+        """
+
+        self.sentences = sentences
+        self.params = params
+        self.callback = callback
+        self.finished = finished
+        self.cache_key = cache_key
+
+        # Where the engine is in sentences, and whether it was woken since
+        # it last ran.
+        self.iterator = None
+        self.woken = False
+
+        self.cancelled = False
+
+    def cancel(self):
+        """ Stop synthesising this job as soon as possible.
+
+        """
+
+        self.cancelled = True
+
+
+class SpeechEngine(object):
+    """ Initializes espeak once and synthesises queued jobs in order.
+
+    """
+
+    def __init__(self):
+        """ SpeechEngine() -> Initialize espeak and start the synthesis
+        thread.  Use get_engine instead of creating one directly.
+
+        """
+
+        self.pid = getpid()
+
+        # Serializes every call into libespeak.
+        self._lock = RLock()
+
+        # Initialize espeak and get the sample rate.  Synchronous output
+        # keeps espeak_Synth from returning before all the audio has been
+        # passed to the callback, retrieval may synthesise in another
+        # thread.
+        output = _espeak.AUDIO_OUTPUT_SYNCHRONOUS
+        self._rate = err_check(_espeak.espeak_Initialize(output, 0, None, 0))
+
+        version = _espeak.espeak_Info(None)
+        self._version = version.decode() if version else ''
+
+        self._parameters = {
+            'speed': _espeak.espeakRATE,
+            'pitch': _espeak.espeakPITCH,
+            'volume': _espeak.espeakVOLUME,
+            'range': _espeak.espeakRANGE,
+        }
+
+        # The values jobs get for settings they do not give.
+        self._defaults = {name: _espeak.espeak_GetParameter(param, 0)
+                          for name, param in self._parameters.items()}
+        self._defaults['voice'] = 'en-us'
+
+        # The settings espeak is currently using.
+        self._applied = {}
+
+        # Set the synth callback once for all jobs.
+        self._job = None
+        self._espeak_synth_callback = _espeak.t_espeak_callback(self._callback)
+        _espeak.espeak_SetSynthCallback(self._espeak_synth_callback)
+
+        # The jobs to run in order, and the jobs that gave up the engine
+        # until it is woken.
+        self._jobs = deque()
+        self._waiting = []
+        self._jobs_changed = Condition()
+        self._wakes = 0
+        self._quit = False
+
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+        atexit.register(self.terminate)
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    @property
+    def rate(self) -> int:
+        """ The sample rate of the synthesised audio.
+
+        """
+
+        return self._rate
+
+    @property
+    def version(self) -> str:
+        """ The espeak version string.
+
+        """
+
+        return self._version
+
+    def default(self, name: str):
+        """ default(name) -> Returns the default value of the setting name.
+
+        """
+
+        return self._defaults[name]
+
+    def submit(self, job: SynthJob) -> SynthJob:
+        """ submit(job) -> Queue job to be synthesised after any earlier
+        jobs.
+
+        """
+
+        with self._jobs_changed:
+            self._jobs.append(job)
+            self._jobs_changed.notify()
+
+        return job
+
+    def wake(self):
+        """ Run the jobs that gave up the engine again, because something
+        they were waiting for may have changed.
+
+        """
+
+        with self._jobs_changed:
+            self._wakes += 1
+            if self._waiting:
+                for job in self._waiting:
+                    job.woken = True
+                self._jobs.extendleft(reversed(self._waiting))
+                del self._waiting[:]
+                self._jobs_changed.notify()
+
+    def cancel(self, job: SynthJob):
+        """ Cancel job, aborting it if it is being synthesised.  The callback
+        returns 1 for a cancelled job, which stops espeak_Synth, and the
+        engine thread cancels the rest, since espeak is not thread safe.
+
+        """
+
+        job.cancel()
+
+        # Let it finish if it is waiting.
+        self.wake()
+
+    def _apply(self, params: dict):
+        """ Change only the espeak settings that differ from the ones it is
+        using.
+
+        """
+
+        wanted = dict(self._defaults)
+        wanted.update((k, v) for k, v in params.items() if v is not None)
+
+        voice = wanted['voice']
+        if self._applied.get('voice') != voice:
+            if not isinstance(voice, bytes):
+                voice = voice.encode()
+            err_check(_espeak.espeak_SetVoiceByName(voice))
+            self._applied['voice'] = wanted['voice']
+
+        for name, param in self._parameters.items():
+            value = int(wanted[name])
+            if self._applied.get(name) != value:
+                err_check(_espeak.espeak_SetParameter(param, value, 0))
+                self._applied[name] = value
+
+    def _callback(self, wav, numsamples, events):
+        """ The espeak synth callback, it passes the audio to the current
+        job.
+
+        """
+
+        job = self._job
+        if not job or job.cancelled:
+            return 1
+
+        return job.callback(wav, numsamples, events)
+
+    def _synth(self, text: str):
+        """ Synthesise text, calling the callback with the audio.
+
+        """
+
+        text = text.strip().encode()
+        if not text:
+            return
+
+        text += b'\0'
+        err_check(_espeak.espeak_Synth(text, len(text), 0,
+                                       _espeak.POS_CHARACTER, 0,
+                                       _espeak.espeakCHARS_UTF8, None, None))
+
+    def _next_job(self) -> SynthJob:
+        """ Returns the first queued woken job, or else the first queued
+        job, that does not have to wait for a waiting job with the same
+        callback, or None.  Call it holding _jobs_changed.
+
+        """
+
+        waiting = {id(job.callback) for job in self._waiting}
+        ready = [job for job in self._jobs if id(job.callback) not in waiting]
+        if not ready:
+            return None
+
+        job = next((job for job in ready if job.woken), ready[0])
+        job.woken = False
+        self._jobs.remove(job)
+
+        return job
+
+    def _woken_ready(self) -> bool:
+        """ _woken_ready() -> True if a woken job is waiting to run.
+
+        """
+
+        with self._jobs_changed:
+            return any(job.woken for job in self._jobs)
+
+    def _synth_job(self, job: SynthJob) -> int:
+        """ _synth_job(job) -> Synthesise the sentences of job and return
+        _DONE at the end, _WAITING if it gave up the engine until it is
+        woken, or _READY if it stopped between sentences for a woken job.
+        A woken job is usually a text that playback has caught up with, so
+        it does not wait for a text that is synthesised ahead to finish.
+
+        """
+
+        if job.iterator is None:
+            job.iterator = iter(job.sentences)
+
+        for sentence in job.iterator:
+            if job.cancelled:
+                break
+            elif sentence is None:
+                return _WAITING
+
+            with self._lock:
+                self._apply(job.params)
+                self._synth(sentence)
+
+                # Drop anything espeak still has of the job.
+                if job.cancelled:
+                    err_check(_espeak.espeak_Cancel())
+
+            if not job.cancelled and self._woken_ready():
+                return _READY
+
+        return _DONE
+
+    def _run(self):
+        """ Synthesise the queued jobs one at a time.  A job that gives up
+        the engine waits, without holding up the jobs of other callbacks,
+        until the engine is woken, and then takes over from the running job
+        at its next sentence.
+
+        """
+
+        while True:
+            with self._jobs_changed:
+                job = self._next_job()
+                while job is None:
+                    if self._quit and not self._jobs and not self._waiting:
+                        return
+                    self._jobs_changed.wait()
+                    job = self._next_job()
+                wakes = self._wakes
+
+            result = _DONE
+            try:
+                self._job = job
+                result = self._synth_job(job)
+            except Exception as err:
+                print(err, file=sys_stderr)
+            finally:
+                self._job = None
+
+            if result == _WAITING:
+                with self._jobs_changed:
+                    if self._wakes != wakes or job.cancelled:
+                        # It was woken while running, so try it again.
+                        job.woken = True
+                        self._jobs.appendleft(job)
+                    else:
+                        self._waiting.append(job)
+            elif result == _READY:
+                # Go on once the woken jobs are done.
+                with self._jobs_changed:
+                    self._jobs.appendleft(job)
+            elif job.finished:
+                job.finished()
+
+    def list_voices(self) -> list:
+        """ list_voices() -> Returns a list of (language, name, identifier)
+        of the available voices.
+
+        """
+
+        voice_list = []
+
+        with self._lock:
+            voices = _espeak.espeak_ListVoices(None)
+            for voice in voices:
+                if not voice:
+                    break
+                voice = voice.contents
+                voice_list.append((voice.languages.decode(),
+                                   voice.name.decode(),
+                                   voice.identifier.decode()))
+
+        return voice_list
+
+    def terminate(self):
+        """ Stop the synthesis thread and shut down espeak.
+
+        """
+
+        if self.pid != getpid() or not self._thread.is_alive():
+            return
+
+        # Cancel every job and let them finish, so nothing is left waiting
+        # for them.
+        with self._jobs_changed:
+            current = [self._job] if self._job else []
+            for job in chain(self._jobs, self._waiting, current):
+                job.cancel()
+            self._quit = True
+            self._jobs_changed.notify()
+        self.wake()
+
+        self._thread.join()
+
+        with self._lock:
+            err_check(_espeak.espeak_Terminate())
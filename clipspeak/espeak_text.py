@@ -23,14 +23,26 @@
 
 """
 
+from array import array
+from bisect import bisect_right
+from collections import deque
 from functools import wraps as functools_wraps
-from sys import stderr as sys_stderr
+from sys import stderr as sys_stderr, maxsize as sys_maxsize
+from threading import Condition
 
 from musio.io_base import AudioIO, io_wrapper
 from musio.io_util import silence, msg_out
 # from .espeak import _espeak
 from musio.import_util import LazyImport
 
+from .cache import get_cache, get_phrase_cache
+from .document import Document
+from .engine import get_engine, err_check, SynthJob
+from .events import EventIndex
+from .pcm_buffer import ChunkBuffer, SpillBuffer
+from .planner import ChunkPlanner
+from .text import split_sentences
+
 _espeak = LazyImport('espeak._espeak', globals(), locals(), ['_espeak'], 1)
 
 __supported_dict = {
@@ -50,54 +62,497 @@ class EspeakText(AudioIO):
     # Only supports depth 16
     _valid_depth = (16,)
 
-    def __init__(self, text: str, voice: str='en-us', **kwargs):
-        """ Espeak tts object.
+    # The seconds synthesis stays ahead when reading a Document.
+    _document_lookahead = 30.0
+
+    # How many characters before an offset sentence splitting starts when
+    # no sentence start before it is known, so the sentences are found
+    # again by the time it gets there.
+    _resync_length = 1 << 12
+
+    # How many more characters finding the number of a sentence splits
+    # when it may not take long.
+    _scan_step = 1 << 14
+
+    def __init__(self, text, voice: str='en-us', stream: bool=True,
+                 cache: bool=True, cache_dir: str=None, start: int=0,
+                 lookahead: float=None, rewind: float=0.0,
+                 spill_threshold: int=None, chunk_duration: float=10.0,
+                 first_chunk: float=1.0, **kwargs):
+        """ Espeak tts object.  text is a str or a Document.  If stream is
+        True the text is synthesised a sentence at a time in a background
+        thread and audio can be read as soon as the first sentence is
+        ready, otherwise synthesis finishes before this returns.
+
+        If cache is True previously synthesised text is played from the
+        audio cache, which is also kept in cache_dir if it is given.  New
+        text still reuses the audio of any sentences that were synthesised
+        before, from any text.
+
+        The speed, pitch, volume and range keyword arguments set the
+        initial settings.  Synthesis begins with the sentence at character
+        offset start, and the text before it is skipped.
+
+        If lookahead is given synthesis waits once it is that many seconds
+        ahead of the position, at the end of the chunk it is on, and audio
+        more than rewind seconds behind the position is released, so memory
+        use does not grow with the length of the text.  Seeking back further
+        synthesises it again.  A Document is decoded only as far as
+        synthesis has got, and is read with a lookahead of 30 seconds unless
+        one is given.
+
+        If spill_threshold is given audio beyond that many bytes is moved
+        to a temporary memory mapped file, which is deleted on close.
+
+        Sentences are synthesised in chunks aimed at chunk_duration seconds
+        of audio, except the first that is aimed at first_chunk seconds (or
+        chunk_duration if it is None) so playback starts soon.  Sentences
+        longer than a chunk are split.
 
         """
 
-        # Initialize espeak and get the sample rate.
-        output = _espeak.AUDIO_OUTPUT_RETRIEVAL
-        rate = self._err_check(_espeak.espeak_Initialize(output, 0, None,
-                                                         0))
+        # Use the process wide engine, it only initializes espeak once.
+        self._engine = get_engine()
 
-        super(EspeakText, self).__init__(filename='', mode='rw', depth=16,  rate=rate,
-                                         channels=1)
+        super(EspeakText, self).__init__(filename='', mode='rw', depth=16,
+                                         rate=self._engine.rate, channels=1)
 
         self._text = text
 
+        # The settings synthesis uses, None means the default.
+        self._params = {'voice': voice}
+        for name in ('speed', 'pitch', 'volume', 'range'):
+            value = kwargs.get(name, None)
+            self._params[name] = None if value is None else int(value)
         self._voice = voice
-        self.voice = voice
 
         self._position = 0
-        self._data_buffer = b''
+        if spill_threshold is None:
+            self._data_buffer = ChunkBuffer()
+        else:
+            self._data_buffer = SpillBuffer(spill_threshold)
         self._speaking = False
         self._done = False
         self._buffer_size = 8192
 
-        # Set the retrieval callback
-        self._espeak_synth_callback = _espeak.t_espeak_callback(self)
-        _espeak.espeak_SetSynthCallback(self._espeak_synth_callback)
+        # Notified whenever synthesis produces data or finishes, or the
+        # position moves.
+        self._data_ready = Condition()
+        self._jobs = []
+        self._stream = stream
+
+        self._cache = get_cache(cache_dir) if cache else None
+        self._phrase_cache = get_phrase_cache(cache_dir) if cache else None
+        # Where the audio of the job being synthesised starts.
+        self._job_start = 0
+
+        # The word and sentence positions, and the text offset and sample
+        # the events of the chunk being synthesised are relative to.
+        self._index = EventIndex()
+        self._event_base = (0, 0)
+
+        # Where the next text starts, None until the length of the current
+        # one is needed.
+        self._text_length = 0
+
+        # The seconds of audio to synthesise at a time, and the text offsets
+        # of the sentences in the chunk being synthesised that have not
+        # started yet.
+        self._chunk_duration = chunk_duration
+        self._first_chunk = first_chunk
+        self._sentence_starts = deque()
+
+        # Where the current text starts, and where the sentences found so
+        # far start and what finds the rest.
+        self._text_offset = 0
+        self._sentence_offsets = None
+        self._sentence_scan = None
+
+        # How far ahead of the position synthesis may go and how much is
+        # kept behind it in bytes, and how much a reader is waiting for.
+        bytes_per_second = 2 * self._engine.rate
+        self._lookahead = None
+        if lookahead is None and isinstance(text, Document):
+            lookahead = self._document_lookahead
+        if lookahead is not None:
+            self._lookahead = int(lookahead * bytes_per_second)
+        self._rewind = int(rewind * bytes_per_second)
+        self._wanted = 0
 
         self._closed = False
 
-        self._speak(text)
+        self._speak(text, start)
+
+    def _speak(self, text, start: int=0):
+        """ _speak(text, start=0) -> Queue text to be synthesised a
+        sentence at a time from the sentence at character offset start.
+        The engine runs jobs in order so the audio stays in order.
+
+        """
+
+        # Only the audio of the whole text is cached, a document is too
+        # big to hash before starting.
+        if self._cache is not None and not start and isinstance(text, str):
+            key = self._cache_key(self._cache, text)
+            data = self._cache.get(key)
+        else:
+            key = data = None
+
+        with self._data_ready:
+            self._speaking = True
+            self._done = False
+
+            # Where text starts in everything that was spoken.  The length
+            # of the text before is only needed now, so a document is not
+            # decoded to count it.
+            if self._text_length is None:
+                self._text_length = self._text_offset + len(self._text)
+            text_offset = self._text_length
+            self._text_length = None
+
+            # The sentences found so far are kept when starting over.
+            if text is not self._text:
+                self._sentence_offsets = None
+            self._text = text
+            self._text_offset = text_offset
+
+            if data is not None:
+                # Cached audio can be used right away unless it has to
+                # wait for earlier text to be synthesised.
+                cached = (data, self._cache.get_index(key))
+                self._jobs.append((None, text_offset, cached))
+                if len(self._jobs) == 1:
+                    self._finished()
+                return
+
+            job = SynthJob(None, self._params, self, self._finished, key)
+            self._jobs.append((job, text_offset, None))
+
+        self._submit(job, text, text_offset, start)
+
+        if not self._stream:
+            self._wait_for(-1)
+
+    def _submit(self, job: SynthJob, text: str, text_offset: int,
+                start: int=0):
+        """ Start synthesising text, which starts at text_offset, for job
+        from the sentence at character offset start.
+
+        """
+
+        job.sentences = self._sentences(text, text_offset, job, start)
+        self._engine.submit(job)
+
+    def _restart(self, offset: int):
+        """ Throw away all the audio and synthesise the current text again
+        from the sentence at character offset in it.
+
+        """
+
+        self._cancel()
+        self._wait_for(-1)
+
+        with self._data_ready:
+            self._data_buffer.clear()
+            self._index.clear()
+            self._position = self._length = self._job_start = 0
+            self._text_length = self._text_offset
+
+        self._speak(self._text, offset)
+
+    def _cancel(self):
+        """ Cancel every queued job.
+
+        """
+
+        with self._data_ready:
+            jobs = [job for job, _, _ in self._jobs if job]
+        for job in jobs:
+            self._engine.cancel(job)
+
+        # Wake up readers waiting for synthesis.
+        with self._data_ready:
+            self._data_ready.notify_all()
+
+    def _has_room(self, job: SynthJob=None, pending: int=0) -> bool:
+        """ True if synthesis may add more audio, because it is not too far
+        ahead of the position, counting pending bytes that are on their way,
+        or a reader is waiting for more, or job was cancelled.  Call it
+        holding _data_ready.
+
+        """
+
+        if self._lookahead is None or self._closed or not self._speaking:
+            return True
+        elif job and job.cancelled:
+            return True
+
+        ahead = len(self._data_buffer) - self._position + pending
+        return ahead < max(self._lookahead, self._wanted)
+
+    def _release(self):
+        """ Free the audio more than the rewind window behind the position.
+        Call it holding _data_ready.
+
+        """
+
+        if self._lookahead is not None:
+            self._data_buffer.release(self._position - self._rewind)
+
+            # Let synthesis know if it can go on.
+            if self._has_room():
+                self._engine.wake()
+
+        self._data_ready.notify_all()
+
+    def _wait_room(self, job: SynthJob):
+        """ Generate None, which gives up the engine to other texts, until
+        synthesis for job may add more audio.
+
+        """
+
+        while True:
+            with self._data_ready:
+                if self._has_room(job):
+                    return
+            yield None
+
+    def _cache_key(self, cache, text: str) -> str:
+        """ Returns the key of text with the current settings in cache.
+
+        """
+
+        params = {name: self._get_param(name) for name in self._params}
+        params['version'] = self._engine.version
 
-    def _speak(self, text):
-        """ _open() -> Open the classes file and set it up for read/write
-        access.
+        return cache.key(text, **params)
+
+    def _append_cached(self, data: bytes, index: bytes, text_offset: int):
+        """ Add cached audio and its events to the end of the buffer.
+
+        """
+
+        sample = len(self._data_buffer) // 2
+        self._data_buffer.append(data)
+        self._length = len(self._data_buffer)
+
+        if index:
+            self._index.extend(EventIndex.from_bytes(index), text_offset,
+                               sample)
+
+    def _split_start(self, text, start: int) -> int:
+        """ _split_start(text, start) -> Returns the character offset to
+        start splitting text at to find the sentence that holds start, the
+        start of that sentence if it was found already, or a little before
+        start, instead of splitting all the text before it.
+
+        """
+
+        offsets = self._sentence_offsets
+        if text is self._text and offsets and offsets[-1] > start:
+            return offsets[max(bisect_right(offsets, start) - 1, 0)]
+
+        return max(start - self._resync_length, 0)
+
+    def _spans(self, text: str, text_offset: int, start: int=0):
+        """ Generate (offset, sentence) for the sentences of text from the
+        one at character offset start, without the space around them, where
+        offset is the offset of the first character in all the text spoken.
+
+        """
+
+        # Nothing is kept of the sentences already synthesised, and the
+        # text before start is mostly skipped.
+        begin = self._split_start(text, start)
+        if not begin:
+            source = text
+        elif isinstance(text, Document):
+            source = text.chunks(begin)
+        else:
+            source = text[begin:]
+
+        language = self._get_param('voice')
+        for offset, sentence in split_sentences(source, language=language):
+            offset += begin
+            # Skip to the sentence that contains start.
+            if offset + len(sentence) <= start:
+                continue
+
+            stripped = sentence.replace('\n', ' ').strip()
+            if stripped:
+                offset += len(sentence) - len(sentence.lstrip())
+                yield text_offset + offset, stripped
+
+    def _sentences(self, text: str, text_offset: int, job: SynthJob,
+                   start: int=0):
+        """ Generate the chunks of text from the sentence at character
+        offset start that job has to synthesise.  Sentences in the phrase
+        cache are added to the buffer instead, and the audio of the rest is
+        cached once the engine has synthesised them.  This runs in the
+        engine thread so the audio stays in order.
+
+        """
+
+        planner = ChunkPlanner(self._get_param('voice'),
+                               self._get_param('speed'),
+                               self._chunk_duration, self._first_chunk)
+
+        for chunk in planner.chunks(self._spans(text, text_offset, start)):
+            # The sentences that are not cached are synthesised together.
+            run = []
+            for offset, sentence in chunk:
+                key = data = None
+                if self._phrase_cache is not None:
+                    key = self._cache_key(self._phrase_cache, sentence)
+                    data = self._phrase_cache.get(key)
+                if data is None:
+                    run.append((offset, sentence, key))
+                    continue
+
+                if run:
+                    yield from self._synth_run(text, text_offset, run, job,
+                                               planner)
+                    run = []
+
+                # Wait for playback to catch up.
+                yield from self._wait_room(job)
+                with self._data_ready:
+                    if job.cancelled:
+                        return
+
+                    index = self._phrase_cache.get_index(key)
+                    self._index.add_sentence(offset,
+                                             len(self._data_buffer) // 2)
+                    self._append_cached(data, index, offset)
+                    self._data_ready.notify_all()
+
+            if run:
+                yield from self._synth_run(text, text_offset, run, job,
+                                           planner)
+            if job.cancelled:
+                break
+
+            # The settings may have changed.
+            planner.voice = self._get_param('voice')
+            planner.speed = self._get_param('speed')
+
+    def _synth_run(self, text: str, text_offset: int, run: list,
+                   job: SynthJob, planner: ChunkPlanner):
+        """ Generate the text of the sentences in run, a list of (offset,
+        sentence, key), for the engine to synthesise in one go.  Afterwards
+        correct the predictions of planner with the length of the audio,
+        and put the audio of each sentence in the phrase cache under key.
+
+        """
+
+        first = run[0][0]
+        last, sentence, _ = run[-1]
+        end = last + len(sentence)
+
+        # Wait for playback to catch up.
+        yield from self._wait_room(job)
+        with self._data_ready:
+            if job.cancelled:
+                return
+
+            sample = len(self._data_buffer) // 2
+            number = self._index.sentences
+            self._index.add_sentence(first, sample)
+
+            # Word events are relative to the chunk, and the later sentences
+            # start at their first word.
+            self._event_base = (first, sample)
+            self._sentence_starts = deque(offset for offset, _, _ in run[1:])
+
+        # The engine asks for the next chunk after synthesising this one.
+        yield text[first - text_offset:end - text_offset].replace('\n', ' ')
+
+        if job.cancelled or not self._speaking:
+            return
+
+        cached = []
+        with self._data_ready:
+            self._sentence_starts.clear()
+            if sample * 2 < self._data_buffer.start:
+                # Some of it was played and released already.
+                return
+
+            stop = len(self._data_buffer) // 2
+            planner.calibrate(end - first, (stop - sample) / self._engine.rate)
+
+            # Without a word the start of a sentence is not known.
+            if (self._phrase_cache is None or
+                    self._index.sentences - number != len(run)):
+                return
+
+            starts = [self._index.sentence_sample(number + i)
+                      for i in range(len(run))] + [stop]
+            for (offset, _, key), begin, until in zip(run, starts,
+                                                      starts[1:]):
+                if until > begin:
+                    data = self._data_buffer.read(begin * 2,
+                                                  (until - begin) * 2)
+                    index = self._index.slice(begin, until, offset)
+                    cached.append((key, data, index.to_bytes()))
+
+        for key, data, index in cached:
+            self._phrase_cache.put(key, data, index)
+
+    def _finished(self):
+        """ Called by the engine when a job is done.
 
         """
 
-        self._speaking = True
+        with self._data_ready:
+            job, text_offset, cached = self._jobs.pop(0)
+
+            if cached:
+                self._append_cached(*cached, text_offset)
+            elif (job.cache_key and not job.cancelled and self._speaking and
+                  self._job_start >= self._data_buffer.start and
+                  not self._data_buffer.spilled and
+                  self._cache.fits(len(self._data_buffer) - self._job_start)):
+                # Cache the audio and events of the finished job, unless it
+                # is too big to keep or was spilled to save memory.
+                size = len(self._data_buffer) - self._job_start
+                data = self._data_buffer.read(self._job_start, size)
+                index = self._index.slice(self._job_start // 2,
+                                          (self._job_start + size) // 2,
+                                          text_offset)
+                self._cache.put(job.cache_key, data, index.to_bytes())
+
+            # Use any cached audio that was waiting for this job.
+            while self._jobs and self._jobs[0][0] is None:
+                _, text_offset, cached = self._jobs.pop(0)
+                self._append_cached(*cached, text_offset)
+
+            self._length = len(self._data_buffer)
+            self._job_start = self._length
+
+            if not self._jobs:
+                self._done = True
+                self._speaking = False
+            self._data_ready.notify_all()
+
+    def _wait_for(self, size: int):
+        """ Block until size bytes after the current position have been
+        synthesised or there will be no more data.  A negative size waits
+        for synthesis to finish.
 
-        text = text.strip().encode() + b'\0'
-        text_length = len(text)
+        """
+
+        with self._data_ready:
+            # Synthesis does not wait for playback while a reader waits.
+            self._wanted = size if size >= 0 else sys_maxsize
+            self._data_ready.notify_all()
+            if self._lookahead is not None:
+                self._engine.wake()
 
-        # Speak the file
-        self._err_check(_espeak.espeak_Synth(text, text_length, 0,
-                                             _espeak.POS_CHARACTER, 0,
-                                             _espeak.espeakCHARS_UTF8,
-                                             None, None))
+            self._data_ready.wait_for(lambda: self._done or self._closed or
+                                      (size >= 0 and
+                                       len(self._data_buffer) -
+                                       self._position >= size))
+            self._wanted = 0
 
     def __repr__(self):
         """ __repr__ -> Returns a python expression to recreate this instance.
@@ -116,39 +571,72 @@ class EspeakText(AudioIO):
         return getattr(self, item)
 
     def __call__(self, wav, numsamples, events):
-        """ Make the class callable so it can be called as the espeak synth
-        callback.
+        """ Make the class callable so it can be called by the engine with
+        the synthesised audio.
 
         """
 
-        # Stop if the end of the synthesis is reached.
+        # The end of a sentence was reached.
         if not wav:
-            self._done = True
-            self._speaking = False
-            return 1
+            return 0 if self._speaking else 1
 
-        # Append the data to the buffer.
-        self._data_buffer += _espeak.string_at(wav, numsamples *
-                                               _espeak.sizeof(_espeak.c_short))
+        with self._data_ready:
+            if events:
+                self._add_events(events)
 
-        # Update length
-        self._length = len(self._data_buffer)
+            # Copy the samples straight from wav to the end of the buffer.
+            self._data_buffer.append_from(wav, numsamples *
+                                          _espeak.sizeof(_espeak.c_short))
+
+            # Update length
+            self._length = len(self._data_buffer)
+
+            self._data_ready.notify_all()
 
         # Return value 0 means to keep playing 1 means to stop.
         return 0 if self._speaking else 1
 
+    def _add_events(self, events):
+        """ Add the word events in the espeak_EVENT array events, and the
+        sentences they start, to the index.
+
+        """
+
+        text_offset, sample = self._event_base
+        rate = self._engine.rate
+
+        i = 0
+        while events[i].type != _espeak.espeakEVENT_LIST_TERMINATED:
+            event = events[i]
+            if event.type == _espeak.espeakEVENT_WORD:
+                # text_position counts from 1 and audio_position is in ms.
+                offset = text_offset + event.text_position - 1
+                start = sample + event.audio_position * rate // 1000
+
+                # The first word of a later sentence in the chunk starts it.
+                starts = self._sentence_starts
+                while starts and starts[0] <= offset:
+                    self._index.add_sentence(starts.popleft(), start)
+
+                self._index.add_word(offset, start)
+            i += 1
+
     def _err_check(self, ret_val):
         """ Checks the 'ret_val' for error status (<0) and prints and error
         message.  Returns 'ret_val' for the calling function to use.
 
         """
-        try:
-            assert(ret_val >= 0)
-        except Exception as err:
-            print("There was and error %s %s" % (err, ret_val),
-                  file=sys_stderr)
 
-        return ret_val
+        return err_check(ret_val)
+
+    def _get_param(self, name: str):
+        """ Returns the value of the setting name.
+
+        """
+
+        value = self._params[name]
+
+        return self._engine.default(name) if value is None else value
 
     def _get_position(self) -> int:
         """ Returns the current position.
@@ -162,8 +650,159 @@ class EspeakText(AudioIO):
 
         """
 
-        if position <= self._length:
-            self._position = position
+        with self._data_ready:
+            if self._data_buffer.start <= position <= self._length:
+                self._position = position
+                self._release()
+
+    @property
+    def index(self) -> EventIndex:
+        """ The index of word and sentence positions.
+
+        """
+
+        return self._index
+
+    @property
+    def word(self) -> int:
+        """ The number of the word at the current position, counting from
+        where synthesis last started, or -1.
+
+        """
+
+        return self.word_at(self._position)
+
+    @property
+    def sentence(self) -> int:
+        """ The number of the sentence at the current position or -1.
+
+        """
+
+        return self.sentence_at(self._position)
+
+    def word_at(self, position: int) -> int:
+        """ word_at(position) -> Returns the number of the word at byte
+        position or -1.  Words are numbered from the sentence synthesis last
+        started at, which a seek that synthesises the text again moves, so
+        the numbers of words from before a seek no longer hold after it.
+
+        """
+
+        return self._index.word_at(position // 2)
+
+    def sentence_at(self, position: int, scan: bool=True) -> int:
+        """ sentence_at(position, scan=True) -> Returns the number of the
+        sentence at byte position or -1.  Numbering the sentences splits
+        the text before them, so if scan is False it is only split a little
+        further and -1 is returned if the sentence was not reached yet.
+
+        """
+
+        number = self._index.sentence_at(position // 2)
+        if number < 0:
+            return -1
+
+        # Synthesis may not have started at the first sentence.
+        offset = self._index.sentence_text(number) - self._text_offset
+        limit = sys_maxsize if scan else self._scan_step
+        offsets = self._find_sentences(offset=offset, limit=limit)
+        if self._sentence_scan is not None and (not offsets or
+                                                offsets[-1] <= offset):
+            return -1
+
+        return bisect_right(offsets, offset) - 1
+
+    def _find_sentences(self, offset: int=sys_maxsize,
+                        count: int=sys_maxsize,
+                        limit: int=sys_maxsize) -> array:
+        """ Returns the character offsets of the sentences in the current
+        text, found as far as the one after character offset, until there
+        are count of them, or until about limit more characters were split.
+        The text is only split as far as it has to be, and never twice.
+
+        """
+
+        if self._sentence_offsets is None:
+            self._sentence_offsets = array('Q')
+            self._sentence_scan = split_sentences(
+                self._text, language=self._get_param('voice'))
+
+        offsets = self._sentence_offsets
+        stop = offsets[-1] + limit if offsets else limit
+        while (self._sentence_scan is not None and len(offsets) < count and
+               (not offsets or offsets[-1] <= offset)):
+            span = next(self._sentence_scan, None)
+            if span is None:
+                self._sentence_scan = None
+                break
+
+            start, sentence = span
+            if sentence.strip():
+                offsets.append(start + len(sentence) - len(sentence.lstrip()))
+            if start > stop:
+                break
+
+        return offsets
+
+    def seek_word(self, number: int) -> int:
+        """ seek_word(number) -> Move to the start of word number, counting
+        from where synthesis last started, and return the new position.
+        Unknown words are ignored.  If the word was released synthesis starts
+        over from its sentence, and the words are numbered from there.
+
+        """
+
+        if 0 <= number < self._index.words:
+            position = self._index.word_sample(number) * 2
+            if position < self._data_buffer.start:
+                # It was released so synthesise it again.
+                offset = self._index.word_text(number) - self._text_offset
+                self._restart(offset)
+            else:
+                self._set_position(position)
+
+        return self._position
+
+    def seek_sentence(self, number: int) -> int:
+        """ seek_sentence(number) -> Move to the start of sentence number
+        and return the new position.  Unknown sentences are ignored.
+
+        """
+
+        offsets = self._find_sentences(count=number + 1)
+        if 0 <= number < len(offsets):
+            self.seek_text_offset(offsets[number])
+
+        return self._position
+
+    def seek_text_offset(self, offset: int) -> int:
+        """ seek_text_offset(offset) -> Move to the start of the word at
+        character offset in the current text and return the new position.
+        If that part of the text has not been synthesised, synthesis starts
+        over from its sentence instead of working through the text before
+        it.
+
+        """
+
+        offset += self._text_offset
+
+        with self._data_ready:
+            count = self._index.sentences
+            synthesised = count and self._index.sentence_text(0) <= offset
+            if synthesised and not self._done:
+                # The last sentence may still be being synthesised.
+                synthesised = offset < self._index.sentence_text(count - 1)
+            if synthesised:
+                # It may have been played and released.
+                position = self._index.text_sample(offset) * 2
+                synthesised = position >= self._data_buffer.start
+
+        if synthesised:
+            self._set_position(self._index.text_sample(offset) * 2)
+        else:
+            self._restart(offset - self._text_offset)
+
+        return self._position
 
     @property
     def range(self):
@@ -171,7 +810,7 @@ class EspeakText(AudioIO):
 
         """
 
-        return _espeak.espeak_GetParameter(_espeak.espeakRANGE, 1)
+        return self._get_param('range')
 
     @range.setter
     def range(self, value):
@@ -179,8 +818,7 @@ class EspeakText(AudioIO):
 
         """
 
-        self._err_check(_espeak.espeak_SetParameter(_espeak.espeakRANGE,
-                                                    int(value), 0))
+        self._params['range'] = int(value)
 
     @property
     def pitch(self):
@@ -188,7 +826,7 @@ class EspeakText(AudioIO):
 
         """
 
-        return _espeak.espeak_GetParameter(_espeak.espeakPITCH, 1)
+        return self._get_param('pitch')
 
     @pitch.setter
     def pitch(self, value):
@@ -196,8 +834,7 @@ class EspeakText(AudioIO):
 
         """
 
-        self._err_check(_espeak.espeak_SetParameter(_espeak.espeakPITCH,
-                                                    int(value), 0))
+        self._params['pitch'] = int(value)
 
     @property
     def volume(self):
@@ -205,7 +842,7 @@ class EspeakText(AudioIO):
 
         """
 
-        return _espeak.espeak_GetParameter(_espeak.espeakVOLUME, 1)
+        return self._get_param('volume')
 
     @volume.setter
     def volume(self, value):
@@ -213,8 +850,7 @@ class EspeakText(AudioIO):
 
         """
 
-        self._err_check(_espeak.espeak_SetParameter(_espeak.espeakVOLUME,
-                                                    int(value), 0))
+        self._params['volume'] = int(value)
 
     @property
     def speed(self):
@@ -222,7 +858,7 @@ class EspeakText(AudioIO):
 
         """
 
-        return _espeak.espeak_GetParameter(_espeak.espeakRATE, 1)
+        return self._get_param('speed')
 
     @speed.setter
     def speed(self, value):
@@ -230,8 +866,7 @@ class EspeakText(AudioIO):
 
         """
 
-        self._err_check(_espeak.espeak_SetParameter(_espeak.espeakRATE,
-                                                    int(value), 0))
+        self._params['speed'] = int(value)
 
     @property
     def voice(self):
@@ -239,8 +874,7 @@ class EspeakText(AudioIO):
 
         """
 
-        voice = _espeak.espeak_GetCurrentVoice()
-        return voice.contents.languages[1:].decode()
+        return self._get_param('voice')
 
     @voice.setter
     def voice(self, value):
@@ -248,12 +882,11 @@ class EspeakText(AudioIO):
 
         """
 
-        self._voice = value
-
-        if not isinstance(value, bytes):
-            value = value.encode()
+        if isinstance(value, bytes):
+            value = value.decode()
 
-        self._err_check(_espeak.espeak_SetVoiceByName(value))
+        self._voice = value
+        self._params['voice'] = value
 
     @property
     def isspeaking(self):
@@ -268,18 +901,21 @@ class EspeakText(AudioIO):
 
         """
 
-        voices = _espeak.espeak_ListVoices(None)
         print("%-21s %-22s %s" % ("Language", "Name", "Identifier"))
         print('-'*55)
-        for voice in voices:
-            if not voice:
-                break
-            voice = voice.contents
-            lang = voice.languages.decode()
-            name = voice.name.decode()
-            ident = voice.identifier.decode()
+        for lang, name, ident in self._engine.list_voices():
             print("%-22s %-22s %s" % (lang, name, ident))
 
+    def cancel(self):
+        """ Stop synthesis as soon as possible.  The audio synthesised so
+        far can still be read, and a read waiting for more returns.
+
+        """
+
+        with self._data_ready:
+            self._speaking = False
+        self._cancel()
+
     def close(self):
         """ Stop speaking.
 
@@ -288,10 +924,17 @@ class EspeakText(AudioIO):
         if not self.closed:
             self._speaking = False
 
-            self._err_check(_espeak.espeak_Cancel())
-            self._err_check(_espeak.espeak_Terminate())
+            # Cancel synthesis but leave espeak initialized for the next
+            # user.
+            self._cancel()
+            self._wait_for(-1)
+
+            with self._data_ready:
+                self._closed = True
+                self._data_ready.notify_all()
 
-            self._closed = True
+                # Free the audio and delete any spill file.
+                self._data_buffer.clear()
 
     @io_wrapper
     def write(self, data: str) -> int:
@@ -312,8 +955,6 @@ class EspeakText(AudioIO):
         elif type(data) is not str:
             return 0
 
-        self._text = data
-
         # Silence stderr
         with silence(sys_stderr):
             # Speak the text.
@@ -321,26 +962,38 @@ class EspeakText(AudioIO):
 
         return len(data)
 
+    @io_wrapper
+    def readinto(self, buffer) -> int:
+        """ readinto(buffer) -> Copy data into the pre-allocated, writable
+        bytes-like object buffer and return the number of bytes copied.
+
+        """
+
+        self._wait_for(memoryview(buffer).nbytes)
+
+        with self._data_ready:
+            count = self._data_buffer.readinto(self._position, buffer)
+            self._position += count
+            self._release()
+
+        return count
+
     @io_wrapper
     def read(self, size: int) -> bytes:
         """ Read from the data buffer.
 
         """
 
-        # Data buffer for
-        data = b''
+        self._wait_for(size)
 
-        while len(data) < size:
-            size -= len(data)
-            data += self._data_buffer[self._position:self._position + size]
+        with self._data_ready:
+            data = self._data_buffer.read(self._position, size)
             self._position += len(data)
+            self._release()
 
-            # Check if the file is finished
+        # Fill the last buffer with silence until it is the requested size.
+        if data and len(data) < size:
             if self._position == self._length and self._done:
-                if data:
-                    # Fill data buffer until it is the requested
-                    # size.
-                    data += b'\x00' * (size - len(data))
-                break
+                data += b'\x00' * (size - len(data))
 
         return data
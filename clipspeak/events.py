@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# An index of the word and sentence events of synthesised audio.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" An index of the word and sentence events of synthesised audio.
+
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class EventIndex(object):
+    """ Maps the text offsets of words and sentences to the sample offsets
+    of their audio.  Events are added in order, so every array is sorted.
+
+    """
+
+    def __init__(self):
+        """ EventIndex() -> An empty index.
+
+        """
+
+        # 64 bit, a long document plays for more than 2**32 samples.
+        self._word_text = array('Q')
+        self._word_sample = array('Q')
+        self._sentence_text = array('Q')
+        self._sentence_sample = array('Q')
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    @property
+    def words(self) -> int:
+        """ The number of words in the index.
+
+        """
+
+        return len(self._word_text)
+
+    @property
+    def sentences(self) -> int:
+        """ The number of sentences in the index.
+
+        """
+
+        return len(self._sentence_text)
+
+    def add_word(self, text_offset: int, sample: int):
+        """ Add a word that starts at text_offset and sample.
+
+        """
+
+        # espeak sometimes repeats the position of the last word.
+        if self._word_text and text_offset <= self._word_text[-1]:
+            return
+
+        self._word_text.append(text_offset)
+        self._word_sample.append(max(sample, self._last(self._word_sample)))
+
+    def add_sentence(self, text_offset: int, sample: int):
+        """ Add a sentence that starts at text_offset and sample.
+
+        """
+
+        if self._sentence_text and text_offset <= self._sentence_text[-1]:
+            return
+
+        self._sentence_text.append(text_offset)
+        self._sentence_sample.append(max(sample,
+                                         self._last(self._sentence_sample)))
+
+    @staticmethod
+    def _last(values: array) -> int:
+        """ Returns the last item of values or 0.
+
+        """
+
+        return values[-1] if values else 0
+
+    def word_text(self, number: int) -> int:
+        """ word_text(number) -> Returns the text offset of word number.
+
+        """
+
+        return self._word_text[number]
+
+    def sentence_text(self, number: int) -> int:
+        """ sentence_text(number) -> Returns the text offset of sentence
+        number.
+
+        """
+
+        return self._sentence_text[number]
+
+    def word_sample(self, number: int) -> int:
+        """ word_sample(number) -> Returns the sample the word number starts
+        at.
+
+        """
+
+        return self._word_sample[number]
+
+    def sentence_sample(self, number: int) -> int:
+        """ sentence_sample(number) -> Returns the sample the sentence number
+        starts at.
+
+        """
+
+        return self._sentence_sample[number]
+
+    def text_sample(self, text_offset: int) -> int:
+        """ text_sample(text_offset) -> Returns the sample the word that
+        contains text_offset starts at.
+
+        """
+
+        number = max(bisect_right(self._word_text, text_offset) - 1, 0)
+        if number < len(self._word_sample):
+            return self._word_sample[number]
+
+        # Without words fall back to the sentence.
+        number = max(bisect_right(self._sentence_text, text_offset) - 1, 0)
+        return self._sentence_sample[number] if self._sentence_sample else 0
+
+    def word_at(self, sample: int) -> int:
+        """ word_at(sample) -> Returns the number of the word being spoken
+        at sample or -1.
+
+        """
+
+        return bisect_right(self._word_sample, sample) - 1
+
+    def sentence_at(self, sample: int) -> int:
+        """ sentence_at(sample) -> Returns the number of the sentence being
+        spoken at sample or -1.
+
+        """
+
+        return bisect_right(self._sentence_sample, sample) - 1
+
+    def extend(self, other, text_offset: int, sample: int):
+        """ Add the events of other moved by text_offset and sample.
+
+        """
+
+        for text, start in zip(other._word_text, other._word_sample):
+            self.add_word(text + text_offset, start + sample)
+        for text, start in zip(other._sentence_text, other._sentence_sample):
+            self.add_sentence(text + text_offset, start + sample)
+
+    def slice(self, start: int, end: int, text_offset: int=0):
+        """ slice(start, end, text_offset=0) -> Returns an index of the events
+        from sample start up to sample end, moved back by start and
+        text_offset.
+
+        """
+
+        index = EventIndex()
+
+        words = slice(bisect_left(self._word_sample, start),
+                      bisect_left(self._word_sample, end))
+        for text, sample in zip(self._word_text[words],
+                                self._word_sample[words]):
+            index.add_word(max(text - text_offset, 0), sample - start)
+
+        sentences = slice(bisect_left(self._sentence_sample, start),
+                          bisect_left(self._sentence_sample, end))
+        for text, sample in zip(self._sentence_text[sentences],
+                                self._sentence_sample[sentences]):
+            index.add_sentence(max(text - text_offset, 0), sample - start)
+
+        return index
+
+    def to_bytes(self) -> bytes:
+        """ to_bytes() -> Returns the index packed into bytes.  It is packed
+        as 32 bit values, which is plenty for the cached audio of one text.
+
+        """
+
+        header = array('I', [len(self._word_text), len(self._sentence_text)])
+
+        return b''.join(array('I', values).tobytes() for values in (
+            header, self._word_text, self._word_sample,
+            self._sentence_text, self._sentence_sample))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """ from_bytes(data) -> Returns the index packed by to_bytes.
+
+        """
+
+        index = cls()
+        values = array('I')
+        values.frombytes(data)
+
+        words, sentences = values[0], values[1]
+        start = 2
+        for name, count in (('_word_text', words), ('_word_sample', words),
+                            ('_sentence_text', sentences),
+                            ('_sentence_sample', sentences)):
+            setattr(index, name, array('Q', values[start:start + count]))
+            start += count
+
+        return index
+
+    def clear(self):
+        """ Remove every event.
+
+        """
+
+        for values in (self._word_text, self._word_sample,
+                       self._sentence_text, self._sentence_sample):
+            del values[:]
@@ -0,0 +1,218 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Synthesise text on several cores.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Synthesise text on several cores.
+
+libespeak is single threaded, so the text is split at sentence boundaries
+and the chunks are synthesised by a pool of processes that each have their
+own espeak.
+
+"""
+
+from collections import deque
+from multiprocessing import Pool, TimeoutError
+from os import cpu_count
+from sys import stderr as sys_stderr
+from threading import Thread
+from time import perf_counter
+
+from .engine import get_engine, SynthJob
+from .espeak_text import EspeakText
+from .planner import ChunkPlanner
+
+
+def _init_worker():
+    """ Initialize espeak when a worker process starts.
+
+    """
+
+    get_engine()
+
+
+def _synthesize(task: tuple) -> tuple:
+    """ Synthesise the text of task, a (text, params) tuple, and return the
+    audio and its packed event index.
+
+    """
+
+    text, params = task
+
+    with EspeakText(text, stream=False, cache=False, first_chunk=None,
+                    **params) as fileobj:
+        return fileobj.read(fileobj.length), fileobj.index.to_bytes()
+
+
+class ParallelEspeakText(EspeakText):
+    """ EspeakText that synthesises on a pool of worker processes.
+
+    """
+
+    def __init__(self, text: str, voice: str='en-us', processes: int=None,
+                 chunk_duration: float=20.0, pool: Pool=None, **kwargs):
+        """ ParallelEspeakText(text, voice='en-us', processes=None,
+        chunk_duration=20.0, pool=None) -> Synthesise text using processes
+        workers (one per cpu by default), or the workers of pool.  The first
+        chunk is aimed at first_chunk seconds of audio so playback can start
+        soon, and the chunks after it grow up to chunk_duration seconds.
+        Only about as many chunks as there are workers are given to them at
+        a time, and no more than fit in the lookahead, so the chunks of a
+        cancelled job do not hold up the next and memory use is bounded.
+
+        """
+
+        self._window = processes or cpu_count() or 1
+
+        self._own_pool = pool is None
+        if self._own_pool:
+            pool = Pool(processes, initializer=_init_worker)
+        self._pool = pool
+
+        # Wall clock time spent synthesising.
+        self._synth_time = 0.0
+
+        super(ParallelEspeakText, self).__init__(text, voice,
+                                                 chunk_duration=chunk_duration,
+                                                 **kwargs)
+
+    def _chunks(self, text: str, planner: ChunkPlanner, start: int=0):
+        """ Generate (offset, chunk) for the chunks of text planned by
+        planner to give to the workers from the sentence at character offset
+        start, where offset is the character offset of the chunk.
+
+        """
+
+        # The text is split as the chunks are needed, from a little before
+        # start.
+        for chunk in planner.chunks(self._spans(text, 0, start)):
+            first = chunk[0][0]
+            last, sentence = chunk[-1]
+            yield first, text[first:last + len(sentence)]
+
+    def _submit(self, job: SynthJob, text: str, text_offset: int,
+                start: int=0):
+        """ Start synthesising text, which starts at text_offset, for job
+        on the pool from the sentence at character offset start.
+
+        """
+
+        Thread(target=self._feed, args=(job, text, text_offset, start),
+               daemon=True).start()
+
+    def _feed(self, job: SynthJob, text: str, text_offset: int, start: int):
+        """ Add the audio from the workers to the buffer in document order.
+
+        """
+
+        params = {name: self._get_param(name) for name in self._params}
+        planner = ChunkPlanner(params['voice'], params['speed'],
+                               self._chunk_duration, self._first_chunk)
+        chunks = self._chunks(text, planner, start)
+        start = perf_counter()
+
+        # The (offset, chunk, result, size) of the chunks given to the
+        # workers in order, and the bytes of audio they are predicted to
+        # make.
+        pending = deque()
+        planned = 0
+        bytes_per_second = 2 * self._engine.rate
+
+        try:
+            while not job.cancelled:
+                # Keep the workers busy, but only give them chunks while
+                # their audio fits in the lookahead, and stop once the job
+                # is cancelled.
+                while len(pending) < self._window:
+                    with self._data_ready:
+                        if pending:
+                            if not self._has_room(job, planned):
+                                break
+                        else:
+                            self._data_ready.wait_for(
+                                lambda: self._has_room(job))
+                    if job.cancelled:
+                        break
+
+                    offset, chunk = next(chunks, (None, None))
+                    if chunk is None:
+                        break
+                    result = self._pool.apply_async(_synthesize,
+                                                    ((chunk, params),))
+                    size = int(planner.predict(len(chunk)) * bytes_per_second)
+                    pending.append((offset, chunk, result, size))
+                    planned += size
+                if job.cancelled or not pending:
+                    break
+
+                # Wake up now and then to check for cancellation.
+                offset, chunk, result, size = pending.popleft()
+                planned -= size
+                data = None
+                while data is None and not job.cancelled:
+                    try:
+                        data, index = result.get(timeout=0.05)
+                    except TimeoutError:
+                        pass
+                if job.cancelled:
+                    break
+
+                with self._data_ready:
+                    # Earlier text goes in the buffer first, and no further
+                    # than lookahead ahead of the position.
+                    self._data_ready.wait_for(lambda: job.cancelled or
+                                              (self._jobs[0][0] is job and
+                                               self._has_room(job)))
+                    if job.cancelled:
+                        break
+
+                    self._append_cached(data, index, text_offset + offset)
+                    self._data_ready.notify_all()
+
+                # Later chunks are planned with the length of this audio.
+                seconds = len(data) / (2 * self._engine.rate)
+                planner.calibrate(len(chunk), seconds)
+        except Exception as err:
+            print(err, file=sys_stderr)
+        finally:
+            self._synth_time += perf_counter() - start
+            self._finished()
+
+    @property
+    def rtf(self) -> float:
+        """ The real-time factor, synthesis time divided by the duration of
+        the audio.  Below 1.0 synthesis is faster than playback.
+
+        """
+
+        seconds = self._length / (2 * self._engine.rate)
+
+        return self._synth_time / seconds if seconds else 0.0
+
+    def close(self):
+        """ Stop speaking and shut down the workers if they are not shared.
+
+        """
+
+        if not self.closed:
+            super(ParallelEspeakText, self).close()
+
+            if self._own_pool:
+                self._pool.terminate()
+                self._pool.join()
@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Buffers for holding synthesised audio data.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Buffers for holding synthesised audio data.
+
+"""
+
+from bisect import bisect_right
+from ctypes import string_at
+from tempfile import TemporaryFile
+import mmap
+
+
+class ChunkBuffer(object):
+    """ An append only store of PCM data kept as a list of chunks.
+
+    Appending never copies the data that is already stored, and reads
+    can start and end anywhere regardless of chunk boundaries.  Chunks
+    at the start can be released, but offsets stay the same.
+
+    """
+
+    def __init__(self):
+        """ ChunkBuffer() -> An empty PCM store.
+
+        """
+
+        # The stored chunks and the absolute offset each one starts at.
+        self._chunks = []
+        self._offsets = []
+
+        self._length = 0
+
+    def __len__(self) -> int:
+        """ The number of bytes stored.
+
+        """
+
+        return self._length
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    def append(self, data: bytes):
+        """ Add data to the end of the buffer without copying it.
+
+        """
+
+        if not data:
+            return
+
+        self._chunks.append(data)
+        self._offsets.append(self._length)
+        self._length += len(data)
+
+    def append_from(self, address, size: int):
+        """ Copy size bytes from the memory at address (a ctypes pointer
+        or an integer address) to the end of the buffer.
+
+        """
+
+        if size > 0:
+            self.append(string_at(address, size))
+
+    @property
+    def spilled(self) -> bool:
+        """ Always False, the data is only kept in memory.
+
+        """
+
+        return False
+
+    @property
+    def start(self) -> int:
+        """ The offset of the first byte that has not been released.
+
+        """
+
+        return self._offsets[0] if self._offsets else self._length
+
+    def release(self, position: int) -> int:
+        """ release(position) -> Free the chunks that end at or before
+        position and return the number of bytes freed.
+
+        """
+
+        count = self._chunk_index(position)
+        if position >= self._length:
+            count = len(self._chunks)
+        if count <= 0:
+            return 0
+
+        freed = (self._offsets[count] if count < len(self._offsets) else
+                 self._length) - self._offsets[0]
+        del self._chunks[:count]
+        del self._offsets[:count]
+
+        return freed
+
+    def _chunk_index(self, position: int) -> int:
+        """ Returns the index of the chunk that holds position.
+
+        """
+
+        return bisect_right(self._offsets, position) - 1
+
+    def readinto(self, position: int, buffer) -> int:
+        """ readinto(position, buffer) -> Copy data starting at position
+        into buffer and return the number of bytes copied.
+
+        """
+
+        view = memoryview(buffer).cast('B')
+        size = min(len(view), self._length - position)
+        if size <= 0 or position < self.start:
+            return 0
+
+        index = self._chunk_index(position)
+        copied = 0
+        while copied < size:
+            chunk = self._chunks[index]
+            start = position + copied - self._offsets[index]
+            count = min(len(chunk) - start, size - copied)
+            # Slice a view so the data is copied once, into buffer.
+            data = memoryview(chunk)[start:start + count]
+            view[copied:copied + count] = data
+            copied += count
+            index += 1
+
+        return copied
+
+    def read(self, position: int, size: int) -> bytes:
+        """ read(position, size) -> Returns up to size bytes starting at
+        position.
+
+        """
+
+        size = min(size, self._length - position)
+        if size <= 0 or position < self.start:
+            return b''
+
+        index = self._chunk_index(position)
+        start = position - self._offsets[index]
+        chunk = self._chunks[index]
+
+        # A read that fits in one chunk is a single slice.
+        if start + size <= len(chunk):
+            return chunk[start:start + size]
+
+        # Otherwise join views of every chunk the read spans so the data
+        # is only copied once.
+        parts = [memoryview(chunk)[start:]]
+        remaining = size - len(parts[0])
+        while remaining > 0:
+            index += 1
+            chunk = self._chunks[index]
+            parts.append(memoryview(chunk)[:remaining])
+            remaining -= len(parts[-1])
+
+        return b''.join(parts)
+
+    def clear(self):
+        """ Remove all the stored data.
+
+        """
+
+        self._chunks.clear()
+        self._offsets.clear()
+        self._length = 0
+
+
+class SpillBuffer(object):
+    """ A PCM store that keeps its data in a ChunkBuffer until it grows past
+    a threshold, and then moves it to a temporary memory mapped file so the
+    page cache decides how much of it stays in memory.
+
+    It has the same methods as ChunkBuffer.
+
+    """
+
+    def __init__(self, threshold: int=16 << 20, directory: str=None):
+        """ SpillBuffer(threshold=16MiB, directory=None) -> An empty PCM
+        store that spills to a temporary file in directory once it holds
+        more than threshold bytes.
+
+        """
+
+        self._threshold = threshold
+        self._directory = directory
+
+        self._memory = ChunkBuffer()
+
+        # The spill file, its mapping and size, and the offset of the
+        # first byte in it.
+        self._file = None
+        self._map = None
+        self._capacity = 0
+        self._base = 0
+
+        self._start = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        """ The number of bytes stored.
+
+        """
+
+        return len(self._memory) if self._map is None else self._length
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "threshold=%s, directory=%r" % (self._threshold,
+                                                    self._directory)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    @property
+    def spilled(self) -> bool:
+        """ True if the data is in the spill file.
+
+        """
+
+        return self._map is not None
+
+    @property
+    def start(self) -> int:
+        """ The offset of the first byte that has not been released.
+
+        """
+
+        return self._memory.start if self._map is None else self._start
+
+    def _spill(self):
+        """ Move the data in memory to a new spill file.
+
+        """
+
+        self._start = self._base = self._memory.start
+        self._length = self._base
+
+        # The file is already unlinked, so it goes away when closed even
+        # if this process does not close it.
+        self._file = TemporaryFile(dir=self._directory)
+        self._capacity = max(self._threshold * 2, mmap.PAGESIZE)
+        self._file.truncate(self._capacity)
+        self._map = mmap.mmap(self._file.fileno(), self._capacity)
+
+        data = self._memory.read(self._base, len(self._memory) - self._base)
+        self._memory.clear()
+        self.append(data)
+
+    def _reserve(self, size: int):
+        """ Grow the spill file so size more bytes fit.
+
+        """
+
+        needed = self._length - self._base + size
+        if needed > self._capacity:
+            self._capacity = max(needed, self._capacity * 2)
+            self._map.resize(self._capacity)
+
+    def append(self, data: bytes):
+        """ Add data to the end of the buffer.
+
+        """
+
+        if self._map is None:
+            self._memory.append(data)
+            if len(self._memory) - self._memory.start > self._threshold:
+                self._spill()
+            return
+
+        size = len(data)
+        if not size:
+            return
+
+        self._reserve(size)
+        offset = self._length - self._base
+        self._map[offset:offset + size] = data
+        self._length += size
+
+    def append_from(self, address, size: int):
+        """ Copy size bytes from the memory at address (a ctypes pointer
+        or an integer address) to the end of the buffer.
+
+        """
+
+        if size > 0:
+            self.append(string_at(address, size))
+
+    def readinto(self, position: int, buffer) -> int:
+        """ readinto(position, buffer) -> Copy data starting at position
+        into buffer and return the number of bytes copied.
+
+        """
+
+        if self._map is None:
+            return self._memory.readinto(position, buffer)
+
+        view = memoryview(buffer).cast('B')
+        size = min(len(view), self._length - position)
+        if size <= 0 or position < self._start:
+            return 0
+
+        # Slice a view so the data is copied once, into buffer, and release
+        # it so the file can still be grown.
+        offset = position - self._base
+        with memoryview(self._map) as data:
+            view[:size] = data[offset:offset + size]
+
+        return size
+
+    def read(self, position: int, size: int) -> bytes:
+        """ read(position, size) -> Returns up to size bytes starting at
+        position.
+
+        """
+
+        if self._map is None:
+            return self._memory.read(position, size)
+
+        size = min(size, self._length - position)
+        if size <= 0 or position < self._start:
+            return b''
+
+        offset = position - self._base
+        return self._map[offset:offset + size]
+
+    def release(self, position: int) -> int:
+        """ release(position) -> Free the data before position and return
+        the number of bytes freed.  Spilled pages are dropped from memory.
+
+        """
+
+        if self._map is None:
+            return self._memory.release(position)
+
+        position = min(position, self._length)
+        if position <= self._start:
+            return 0
+
+        # Only whole pages can be dropped.
+        first = -(-(self._start - self._base) // mmap.PAGESIZE)
+        last = (position - self._base) // mmap.PAGESIZE
+        if last > first and hasattr(self._map, 'madvise'):
+            self._map.madvise(mmap.MADV_DONTNEED, first * mmap.PAGESIZE,
+                              (last - first) * mmap.PAGESIZE)
+
+        freed = position - self._start
+        self._start = position
+
+        return freed
+
+    def clear(self):
+        """ Remove all the stored data and delete the spill file.
+
+        """
+
+        self._memory.clear()
+
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+        self._capacity = self._base = self._start = self._length = 0
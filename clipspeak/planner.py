@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Plan the chunks of text to synthesise at a time.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Plan the chunks of text to synthesise at a time.
+
+Sentences are grouped, or long ones split, into chunks aimed at a number of
+seconds of audio.  How long the audio of some text lasts is predicted from
+its number of characters and the voice and speed, and the prediction is
+corrected with the length of the audio that is actually synthesised.
+
+"""
+
+from threading import RLock
+
+# espeak speeds are in words per minute and a word with the space after it
+# is about six characters, so seconds per character times the speed is
+# about ten.
+_DEFAULT_FACTOR = 10.0
+
+# How far each measurement moves the prediction.
+_WEIGHT = 0.25
+
+# Measurements of less text than this are too noisy to use.
+_MIN_CHARACTERS = 20
+
+# Characters a long sentence is split after, when a space follows them.
+_CLAUSE_ENDS = ',;:\u2014'
+
+# The process wide duration model and the lock protecting its creation.
+_model = None
+_model_lock = RLock()
+
+
+def get_duration_model():
+    """ get_duration_model() -> Returns the process wide duration model, so
+    what is learned from one text is used for the next.
+
+    """
+
+    global _model
+
+    with _model_lock:
+        if _model is None:
+            _model = DurationModel()
+
+        return _model
+
+
+def _cut(text: str, limit: int, longest: int) -> int:
+    """ Returns where to split text, after the last clause that ends within
+    limit characters, or at the last space within longest characters, or
+    the length of text if it is no longer than that.
+
+    """
+
+    cut = max(text.rfind(char + ' ', 0, limit) for char in _CLAUSE_ENDS)
+    if cut >= 0:
+        return cut + 1
+    elif len(text) <= longest:
+        return len(text)
+
+    return text.rfind(' ', 0, longest) + 1 or longest
+
+
+class DurationModel(object):
+    """ Predicts how many seconds the audio of some characters lasts with
+    each voice.  The seconds per character go down as the speed goes up, so
+    one factor per voice covers every speed.
+
+    """
+
+    def __init__(self):
+        """ DurationModel() -> A model that starts from the usual length of
+        a word.
+
+        """
+
+        # Seconds per character times the speed for each voice.
+        self._factors = {}
+        self._lock = RLock()
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    def seconds_per_character(self, voice: str, speed: int) -> float:
+        """ seconds_per_character(voice, speed) -> Returns the predicted
+        seconds of audio per character for voice at speed.
+
+        """
+
+        return self._factors.get(voice, _DEFAULT_FACTOR) / max(speed, 1)
+
+    def predict(self, characters: int, voice: str, speed: int) -> float:
+        """ predict(characters, voice, speed) -> Returns the predicted
+        seconds of audio of characters with voice at speed.
+
+        """
+
+        return characters * self.seconds_per_character(voice, speed)
+
+    def observe(self, characters: int, seconds: float, voice: str,
+                speed: int):
+        """ observe(characters, seconds, voice, speed) -> Correct the
+        prediction for voice with the seconds of audio synthesised from
+        characters at speed.
+
+        """
+
+        if characters < _MIN_CHARACTERS or seconds <= 0:
+            return
+
+        factor = seconds * speed / characters
+
+        with self._lock:
+            old = self._factors.get(voice)
+            if old is None:
+                # The first measurement is better than the guess.
+                self._factors[voice] = factor
+            else:
+                self._factors[voice] = old + _WEIGHT * (factor - old)
+
+
+class ChunkPlanner(object):
+    """ Groups sentences into chunks to synthesise at a time.  The first
+    chunk is aimed at first seconds of audio so playback starts soon, and
+    every chunk after it at growth times the one before, up to duration
+    seconds, so there are fewer and larger synthesis calls.
+
+    """
+
+    def __init__(self, voice: str='en-us', speed: int=175,
+                 duration: float=10.0, first: float=1.0,
+                 growth: float=2.0, model: DurationModel=None):
+        """ ChunkPlanner(voice='en-us', speed=175, duration=10.0, first=1.0,
+        growth=2.0, model=None) -> Plan chunks of text for voice at speed
+        using model, or the process wide duration model.  The voice and
+        speed attributes can be changed between chunks.
+
+        """
+
+        self.voice = voice
+        self.speed = speed
+
+        self._duration = duration
+        self._growth = growth
+        self._target = duration if first is None else min(first, duration)
+
+        self._model = get_duration_model() if model is None else model
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "voice=%r, speed=%r, duration=%r" % (self.voice,
+                                                        self.speed,
+                                                        self._duration)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    @property
+    def target(self) -> float:
+        """ The seconds of audio the next chunk is aimed at.
+
+        """
+
+        return self._target
+
+    def predict(self, characters: int) -> float:
+        """ predict(characters) -> Returns the predicted seconds of audio of
+        characters.
+
+        """
+
+        return self._model.predict(characters, self.voice, self.speed)
+
+    def calibrate(self, characters: int, seconds: float):
+        """ calibrate(characters, seconds) -> Correct the predictions with
+        the seconds of audio synthesised from characters.
+
+        """
+
+        self._model.observe(characters, seconds, self.voice, self.speed)
+
+    def _limit(self, seconds: float) -> int:
+        """ Returns the number of characters predicted to last seconds.
+
+        """
+
+        per_character = self._model.seconds_per_character(self.voice,
+                                                          self.speed)
+
+        return max(int(seconds / per_character), 1)
+
+    def chunks(self, spans):
+        """ chunks(spans) -> Generate lists of the (offset, sentence) tuples
+        from spans to synthesise together, where offset is the character
+        offset of sentence.  A sentence too long for the chunk is split
+        after a clause, or if it is longer than a whole chunk at a space,
+        and the offsets of the pieces are kept.
+
+        """
+
+        chunk = []
+        size = 0
+
+        for offset, sentence in spans:
+            while sentence:
+                limit = self._limit(self._target)
+                if size + len(sentence) <= limit:
+                    chunk.append((offset, sentence))
+                    size += len(sentence)
+                    break
+
+                if not chunk:
+                    # It does not fit on its own, so split off what does.
+                    cut = _cut(sentence, limit, self._limit(self._duration))
+                    chunk.append((offset, sentence[:cut]))
+
+                    rest = sentence[cut:]
+                    sentence = rest.lstrip()
+                    offset += cut + len(rest) - len(sentence)
+
+                yield chunk
+
+                chunk = []
+                size = 0
+                self._target = min(self._target * self._growth,
+                                   self._duration)
+
+        if chunk:
+            yield chunk
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# A shared memory ring buffer for passing audio between processes.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" A shared memory ring buffer for passing audio between processes.
+
+"""
+
+from multiprocessing import Event
+from multiprocessing.shared_memory import SharedMemory
+
+# The header holds the write, read, flush and closed counters as aligned
+# 64 bit integers, each written by only one side, so a store is atomic.
+_WRITE, _READ, _FLUSH, _CLOSED = range(4)
+_HEADER_SIZE = 32
+
+
+class RingBuffer(object):
+    """ A single producer, single consumer ring buffer of bytes in shared
+    memory.  The producer only moves the write counter and the consumer
+    only moves the read counter, so neither needs a lock, and the data is
+    copied straight into and out of the shared memory without pickling.
+
+    """
+
+    def __init__(self, size: int=1 << 15):
+        """ RingBuffer(size=32KiB) -> A ring buffer holding up to size
+        bytes.  Pass it to the producer and consumer processes when they
+        are created.
+
+        """
+
+        self._size = size
+        self._owner = True
+        self._shm = SharedMemory(create=True, size=_HEADER_SIZE + size)
+
+        # Set when data is written or space is freed.
+        self._readable = Event()
+        self._writable = Event()
+
+        self._attach()
+
+    def _attach(self):
+        """ Make views of the counters and data in the shared memory.
+
+        """
+
+        self._counters = self._shm.buf[:_HEADER_SIZE].cast('Q')
+        self._data = self._shm.buf[_HEADER_SIZE:_HEADER_SIZE + self._size]
+
+    def __getstate__(self) -> dict:
+        """ Pickle everything except the memory views.
+
+        """
+
+        state = self.__dict__.copy()
+        del state['_counters'], state['_data']
+        state['_owner'] = False
+
+        return state
+
+    def __setstate__(self, state: dict):
+        """ Attach to the shared memory in the new process.
+
+        """
+
+        self.__dict__.update(state)
+        self._attach()
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s(size=%s)' % (self.__class__.__name__, self._size)
+
+    @property
+    def size(self) -> int:
+        """ The capacity in bytes.
+
+        """
+
+        return self._size
+
+    @property
+    def available(self) -> int:
+        """ The number of bytes that can be read.
+
+        """
+
+        counters = self._counters
+        return counters[_WRITE] - max(counters[_READ], counters[_FLUSH])
+
+    @property
+    def closed(self) -> bool:
+        """ True once the producer has closed the buffer.
+
+        """
+
+        return bool(self._counters[_CLOSED])
+
+    def write(self, data, timeout: float=None) -> int:
+        """ write(data, timeout=None) -> Write data, waiting for space, and
+        return the number of bytes written.  Less is written if the buffer
+        stays full for timeout seconds or is closed.  Producer only.
+
+        """
+
+        data = memoryview(data).cast('B')
+        counters = self._counters
+        total = 0
+
+        while total < len(data) and not counters[_CLOSED]:
+            write = counters[_WRITE]
+            free = self._size - (write - counters[_READ])
+            if not free:
+                # Clear before checking again so a read in between still
+                # wakes us.
+                self._writable.clear()
+                if self._size == write - counters[_READ]:
+                    if not self._writable.wait(timeout):
+                        break
+                continue
+
+            count = min(free, len(data) - total)
+            start = write % self._size
+            first = min(count, self._size - start)
+            self._data[start:start + first] = data[total:total + first]
+            if first < count:
+                self._data[:count - first] = data[total + first:total + count]
+
+            counters[_WRITE] = write + count
+            total += count
+            self._readable.set()
+
+        return total
+
+    def readinto(self, buffer, timeout: float=None) -> int:
+        """ readinto(buffer, timeout=None) -> Copy up to the size of buffer
+        into it, waiting for data, and return the number of bytes copied.
+        Returns 0 if nothing is written for timeout seconds or the buffer is
+        closed and empty.  Consumer only.
+
+        """
+
+        buffer = memoryview(buffer).cast('B')
+        counters = self._counters
+
+        while True:
+            # Skip anything flushed by the producer.
+            read = max(counters[_READ], counters[_FLUSH])
+            if read != counters[_READ]:
+                counters[_READ] = read
+                self._writable.set()
+
+            available = counters[_WRITE] - read
+            if available:
+                break
+            elif counters[_CLOSED]:
+                return 0
+
+            self._readable.clear()
+            if counters[_WRITE] == read and not counters[_CLOSED]:
+                if not self._readable.wait(timeout):
+                    return 0
+
+        count = min(available, len(buffer))
+        start = read % self._size
+        first = min(count, self._size - start)
+        buffer[:first] = self._data[start:start + first]
+        if first < count:
+            buffer[first:count] = self._data[:count - first]
+
+        counters[_READ] = read + count
+        self._writable.set()
+
+        return count
+
+    def flush(self):
+        """ Drop everything written so far that has not been read.
+        Producer only.
+
+        """
+
+        self._counters[_FLUSH] = self._counters[_WRITE]
+        self._writable.set()
+
+    def close(self):
+        """ Mark the buffer closed and wake both sides.
+
+        """
+
+        self._counters[_CLOSED] = 1
+        self._readable.set()
+        self._writable.set()
+
+    def release(self):
+        """ Unmap the shared memory from this process.
+
+        """
+
+        self._counters.release()
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self):
+        """ Unmap and free the shared memory, the process that created it
+        must call this once both sides are done.
+
+        """
+
+        self.release()
+        if self._owner:
+            self._shm.unlink()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# vim: sw=4:ts=4:sts=4:fdm=indent:fdl=0:
+# -*- coding: UTF8 -*-
+#
+# Places to send synthesised audio.
+# Copyright (C) 2013 Josiah Gordon <josiahg@gmail.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+""" Places to send synthesised audio.
+
+A sink is chosen with a spec string, the name of the sink optionally
+followed by a colon and a path, for example 'alsa', 'null',
+'wav:/tmp/speech.wav' or 'pipe:/tmp/speech.fifo'.
+
+"""
+
+from sys import stdout as sys_stdout
+import wave
+
+
+class Sink(object):
+    """ Base class of the audio sinks.  Sinks take 16 bit signed PCM.
+
+    """
+
+    # True if the sink holds a device other programs may want, so it is
+    # closed while paused or idle.
+    exclusive = False
+
+    def __init__(self, rate: int, channels: int=1, path: str=None):
+        """ Sink(rate, channels=1, path=None) -> Sink for audio at rate
+        with channels.
+
+        """
+
+        self._rate = rate
+        self._channels = channels
+        self._path = path
+
+        self.buffer_size = 4096
+        self.closed = False
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "rate=%s, channels=%s, path=%r" % (self._rate,
+                                                      self._channels,
+                                                      self._path)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def __enter__(self):
+        """ Provides the ability to use pythons with statement.
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Close the sink when finished.
+
+        """
+
+        self.close()
+        return not bool(exc_type)
+
+    def write(self, data) -> int:
+        """ write(data) -> Write data and return the number of bytes
+        written.
+
+        """
+
+        raise NotImplementedError
+
+    def close(self):
+        """ Close the sink.
+
+        """
+
+        self.closed = True
+
+
+class AlsaSink(Sink):
+    """ Play the audio with alsa.
+
+    """
+
+    exclusive = True
+
+    def __init__(self, rate: int, channels: int=1, path: str=None):
+        """ AlsaSink(rate, channels=1) -> Open the default alsa device.
+
+        """
+
+        super(AlsaSink, self).__init__(rate, channels, path)
+
+        # Imported here so the other sinks work without alsa.
+        from musio.alsa_io import Alsa
+
+        self._device = Alsa(rate=rate, channels=channels)
+        self.buffer_size = self._device.buffer_size
+
+    def write(self, data) -> int:
+        """ write(data) -> Play data.
+
+        """
+
+        return self._device.write(data)
+
+    def close(self):
+        """ Close the alsa device.
+
+        """
+
+        if not self.closed:
+            self._device.close()
+            self.closed = True
+
+
+class WavSink(Sink):
+    """ Stream the audio into a wav file.  The header is completed when the
+    sink is closed.
+
+    """
+
+    def __init__(self, rate: int, channels: int=1, path: str=None):
+        """ WavSink(rate, channels=1, path='clipspeak.wav') -> Write a wav
+        file at path.
+
+        """
+
+        super(WavSink, self).__init__(rate, channels,
+                                      path or 'clipspeak.wav')
+
+        self._file = wave.open(self._path, 'wb')
+        self._file.setnchannels(channels)
+        self._file.setsampwidth(2)
+        self._file.setframerate(rate)
+
+    def write(self, data) -> int:
+        """ write(data) -> Append data to the file.
+
+        """
+
+        self._file.writeframesraw(data)
+
+        return len(data)
+
+    def close(self):
+        """ Complete the header and close the file.
+
+        """
+
+        if not self.closed:
+            self._file.close()
+            self.closed = True
+
+
+class PipeSink(Sink):
+    """ Write the raw audio to a pipe, fifo or file, or to stdout if the
+    path is '-'.
+
+    """
+
+    def __init__(self, rate: int, channels: int=1, path: str=None):
+        """ PipeSink(rate, channels=1, path='-') -> Write raw audio to
+        path.  Opening a fifo waits for a reader.
+
+        """
+
+        super(PipeSink, self).__init__(rate, channels, path or '-')
+
+        if self._path == '-':
+            self._file = sys_stdout.buffer
+        else:
+            self._file = open(self._path, 'wb', buffering=0)
+
+    def write(self, data) -> int:
+        """ write(data) -> Write data to the pipe.
+
+        """
+
+        try:
+            self._file.write(data)
+        except BrokenPipeError:
+            # Nobody is reading anymore.
+            return 0
+
+        return len(data)
+
+    def close(self):
+        """ Close the pipe.
+
+        """
+
+        if not self.closed:
+            if self._file is not sys_stdout.buffer:
+                self._file.close()
+            else:
+                self._file.flush()
+            self.closed = True
+
+
+class NullSink(Sink):
+    """ Throw the audio away as fast as it comes, for measuring how fast
+    audio is produced.
+
+    """
+
+    def __init__(self, rate: int, channels: int=1, path: str=None):
+        """ NullSink(rate, channels=1) -> Sink that discards audio.
+
+        """
+
+        super(NullSink, self).__init__(rate, channels, path)
+
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        """ write(data) -> Count and discard data.
+
+        """
+
+        size = memoryview(data).nbytes
+        self.bytes_written += size
+
+        return size
+
+
+# The sinks by name.
+sinks = {
+    'alsa': AlsaSink,
+    'wav': WavSink,
+    'pipe': PipeSink,
+    'null': NullSink,
+}
+
+
+def get_sink_class(spec: str):
+    """ get_sink_class(spec) -> Returns the class of the sink named in spec
+    ('name' or 'name:path').
+
+    """
+
+    name = spec.partition(':')[0]
+
+    try:
+        return sinks[name.lower()]
+    except KeyError:
+        raise ValueError("Unknown sink %r, use one of %s." %
+                         (name, ', '.join(sorted(sinks))))
+
+
+def open_sink(spec: str, rate: int, channels: int=1) -> Sink:
+    """ open_sink(spec, rate, channels=1) -> Returns the sink named in spec
+    ('name' or 'name:path') opened for audio at rate with channels.
+
+    """
+
+    path = spec.partition(':')[2]
+
+    return get_sink_class(spec)(rate, channels, path or None)
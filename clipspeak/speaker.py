@@ -19,18 +19,805 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 
-""" Play espeak audio data to alsa.
+""" Play espeak audio data to alsa or another sink.
 
 """
 
-from multiprocessing import Process, Manager, Pipe
+from collections import deque
+from multiprocessing import Process, Pipe, Event, Value, Array
+from multiprocessing.connection import wait as connection_wait
 from io import SEEK_SET, SEEK_CUR, SEEK_END
 from functools import wraps as functools_wraps
-from time import sleep as time_sleep
-
-from musio.alsa_io import Alsa as AudioDevice
+from sys import stderr as sys_stderr
+from queue import Queue, Empty
+from threading import Thread, Lock, RLock
+from time import monotonic
 
+from .cache import cache_stats
+from .engine import get_engine
 from .espeak_text import EspeakText
+from .ring_buffer import RingBuffer
+from .sinks import open_sink, get_sink_class
+
+# The cache counters the player shares, in the order they are kept.
+_CACHE_COUNTERS = ('hits', 'disk_hits', 'misses', 'evictions', 'entries',
+                   'memory_bytes', 'disk_entries', 'disk_bytes')
+_CACHES = ('text', 'phrase')
+
+
+class PlayerState(object):
+    """ The control state shared by a Reader and its player process.  It is
+    kept in shared memory so checking it is a memory read instead of a
+    message to another process.
+
+    """
+
+    def __init__(self):
+        """ PlayerState() -> Stopped, unpaused state.
+
+        """
+
+        self.playing = Event()
+        self.paused = Event()
+
+        # Set while the player has no text.
+        self.idle = Event()
+        self.idle.set()
+
+        # Only the player process writes these, so they need no lock.
+        self.rate = Value('q', 22050, lock=False)
+        self.length = Value('q', 0, lock=False)
+        self.position = Value('q', 0, lock=False)
+        self.word = Value('q', -1, lock=False)
+        self.sentence = Value('q', -1, lock=False)
+
+        # The number of the queued text being played.
+        self.item = Value('q', -1, lock=False)
+
+        # How often a paused player woke up, when it was last asked to
+        # resume and how long the first write after that took in seconds.
+        self.wakeups = Value('q', 0, lock=False)
+        self.resumed_at = Value('d', 0.0, lock=False)
+        self.resume_latency = Value('d', 0.0, lock=False)
+
+        # When playback was last stopped and how long, in seconds, the
+        # player took to be idle again.
+        self.stopped_at = Value('d', 0.0, lock=False)
+        self.stop_latency = Value('d', 0.0, lock=False)
+
+        # How often the device had to wait for a buffer, and how many
+        # buffers were ready when it last asked for one.
+        self.underruns = Value('q', 0, lock=False)
+        self.prefetch_depth = Value('q', 0, lock=False)
+
+        # The counters of the text and phrase caches, which are only in
+        # the player process.
+        self.cache_counters = Array('q', len(_CACHES) * len(_CACHE_COUNTERS),
+                                    lock=False)
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    def update(self, fileobj, pending: int=0):
+        """ Copy the length and location of fileobj, less the pending bytes
+        it has produced that have not been played.
+
+        """
+
+        position = max(fileobj.position - pending, 0)
+
+        self.length.value = fileobj.length
+        self.position.value = position
+        self.word.value = fileobj.word_at(position)
+        # Numbering the sentence can mean splitting all the text before
+        # it, so that is done a bit at a time.
+        self.sentence.value = fileobj.sentence_at(position, scan=False)
+
+    def update_caches(self):
+        """ Copy the counters of the caches of this process.  They are
+        copied between texts.
+
+        """
+
+        stats = cache_stats()
+        counters = self.cache_counters
+        i = 0
+        for cache in _CACHES:
+            for name in _CACHE_COUNTERS:
+                counters[i] = stats[cache].get(name, 0)
+                i += 1
+
+    def caches(self) -> dict:
+        """ caches() -> Returns the counters of the text and phrase caches
+        as {'text': counters, 'phrase': counters}.
+
+        """
+
+        counters = iter(self.cache_counters[:])
+
+        return {cache: dict(zip(_CACHE_COUNTERS, counters))
+                for cache in _CACHES}
+
+
+class RingDevice(object):
+    """ Stands in for the audio device in the player process and passes the
+    audio on to an OutputWorker through a ring buffer.
+
+    """
+
+    # Closing it drops the audio that has not been played, so it is closed
+    # when paused like a real device.
+    exclusive = True
+
+    def __init__(self, ring: RingBuffer, buffer_size: int=4096):
+        """ RingDevice(ring, buffer_size=4096) -> Device writing to ring.
+
+        """
+
+        self._ring = ring
+        self.buffer_size = buffer_size
+        self.closed = False
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "buffer_size=%s" % self.buffer_size
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def write(self, data) -> int:
+        """ write(data) -> Write data to the ring buffer, waiting while it
+        is full.
+
+        """
+
+        return self._ring.write(data)
+
+    def close(self):
+        """ Drop the audio that has not been played.
+
+        """
+
+        self._ring.flush()
+        self.closed = True
+
+
+class BufferWriter(object):
+    """ Writes audio buffers to a device from its own thread.  Buffers are
+    filled ahead of the writer so the device never waits on reading or
+    synthesis unless they all run out, which is counted as an underrun.
+
+    """
+
+    def __init__(self, state: PlayerState, buffer_size: int, depth: int=2):
+        """ BufferWriter(state, buffer_size, depth=2) -> Writer with enough
+        buffers of buffer_size bytes to keep depth ready while one is
+        written and one is filled.  Its counters are kept in state.
+
+        """
+
+        self._state = state
+
+        self._free = Queue()
+        self._filled = Queue()
+        for _ in range(depth + 2):
+            self._free.put(bytearray(buffer_size))
+
+        # The number of bytes in the filled buffers.
+        self._lock = Lock()
+        self._pending = 0
+
+        # Buffers are written about 20ms at a time, so dropping the rest
+        # of one does not have to wait for all of it to be played.
+        self._slice = max(2 * (state.rate.value // 50), 2)
+        self._dropping = False
+
+        self._device = None
+        self._thread = None
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        return '%s()' % self.__class__.__name__
+
+    @property
+    def running(self) -> bool:
+        """ True if the writer thread is running.
+
+        """
+
+        return self._thread is not None
+
+    @property
+    def pending(self) -> int:
+        """ The number of bytes filled but not yet written.
+
+        """
+
+        with self._lock:
+            return self._pending
+
+    def start(self, device):
+        """ Start writing to device.
+
+        """
+
+        self._device = device
+        self._dropping = False
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def get_buffer(self) -> bytearray:
+        """ get_buffer() -> Returns an empty buffer to fill, waiting if
+        enough are filled already.
+
+        """
+
+        return self._free.get()
+
+    def put(self, buf: bytearray, count: int):
+        """ Queue the first count bytes of buf to be written.
+
+        """
+
+        with self._lock:
+            self._pending += count
+        self._filled.put((buf, count))
+
+    def _take(self, item: tuple) -> bytearray:
+        """ Take a filled buffer out of the pending count and return it.
+
+        """
+
+        buf, count = item
+        with self._lock:
+            self._pending -= count
+
+        return buf
+
+    def _run(self):
+        """ Write the filled buffers until told to stop.
+
+        """
+
+        primed = False
+
+        while True:
+            self._state.prefetch_depth.value = self._filled.qsize()
+            try:
+                item = self._filled.get_nowait()
+            except Empty:
+                item = self._filled.get()
+                if item is not None and primed:
+                    self._state.underruns.value += 1
+
+            if item is None:
+                break
+
+            buf = self._take(item)
+            primed = True
+            try:
+                data = memoryview(buf)[:item[1]]
+                for start in range(0, len(data), self._slice):
+                    if self._dropping:
+                        break
+                    self._device.write(data[start:start + self._slice])
+            finally:
+                self._free.put(buf)
+
+    def flush(self) -> int:
+        """ flush() -> Drop the filled buffers and return how many bytes
+        they held.
+
+        """
+
+        dropped = 0
+        while True:
+            try:
+                item = self._filled.get_nowait()
+            except Empty:
+                break
+
+            if item is None:
+                # finish is stopping the writer, leave that for it to see.
+                self._filled.put(None)
+                break
+
+            dropped += item[1]
+            self._free.put(self._take(item))
+
+        return dropped
+
+    def drop(self):
+        """ Drop the filled buffers and the rest of the one being written,
+        and anything put after this until the writer is started again.
+
+        """
+
+        self._dropping = True
+        self.flush()
+
+    def finish(self):
+        """ Write the filled buffers and stop the writer thread.
+
+        """
+
+        if self._thread is not None:
+            self._filled.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def stop(self):
+        """ Drop the filled buffers and stop the writer thread once it has
+        written the one it is writing.
+
+        """
+
+        self.flush()
+        self.finish()
+
+
+class OutputWorker(object):
+    """ The output process.  It writes the audio from a ring buffer to the
+    audio device, so device writes never wait on synthesis.
+
+    """
+
+    def __init__(self, ring: RingBuffer, state: PlayerState,
+                 idle_timeout: float=0.5, buffer_size: int=4096,
+                 sink: str='alsa'):
+        """ OutputWorker(ring, state, idle_timeout=0.5, buffer_size=4096,
+        sink='alsa') -> Play the audio in ring at the rate in state,
+        buffer_size bytes at a time, to the sink named by sink.  A device
+        is closed after idle_timeout seconds without audio.
+
+        """
+
+        self._ring = ring
+        self._state = state
+        self._idle_timeout = idle_timeout
+        self._buffer_size = buffer_size
+        self._sink = sink
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "idle_timeout=%s, buffer_size=%s, sink=%r" % (
+            self._idle_timeout, self._buffer_size, self._sink)
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def run(self):
+        """ Play the ring buffer until it is closed.
+
+        """
+
+        device = None
+        buf = bytearray(self._buffer_size)
+        view = memoryview(buf)
+
+        try:
+            while not self._ring.closed:
+                timeout = None
+                if device is not None and device.exclusive:
+                    timeout = self._idle_timeout
+
+                count = self._ring.readinto(buf, timeout)
+                if not count:
+                    # Nothing to play for a while, so let other processes
+                    # use the device.
+                    if device is not None and device.exclusive:
+                        device.close()
+                        device = None
+                    continue
+
+                if device is None:
+                    device = open_sink(self._sink, self._state.rate.value)
+
+                device.write(view[:count])
+        finally:
+            if device is not None:
+                device.close()
+
+            self._ring.release()
+
+
+class PlayerWorker(object):
+    """ The long lived player process.  It keeps espeak initialized and the
+    audio device open between texts, and plays the texts it is sent.
+
+    """
+
+    def __init__(self, state: PlayerState, pipe: Pipe,
+                 idle_timeout: float=5.0, ring: RingBuffer=None,
+                 prefetch: int=2, sink: str='alsa', stop_pipe: Pipe=None):
+        """ PlayerWorker(state, pipe, idle_timeout=5.0, ring=None,
+        prefetch=2, sink='alsa', stop_pipe=None) -> Player that takes
+        commands from pipe and shares its state through state, and plays to
+        the sink named by sink.  A device is closed after idle_timeout
+        seconds without a text.  If ring is given the audio is written to it
+        for an OutputWorker instead of to the sink.  A writer thread feeds
+        the sink while prefetch buffers are filled ahead of it.  Anything
+        sent on stop_pipe stops playback right away.
+
+        """
+
+        self._state = state
+        self._pipe = pipe
+        self._stop_pipe = stop_pipe
+        self._idle_timeout = idle_timeout
+        self._ring = ring
+        self._prefetch = prefetch
+        self._sink = sink
+        self._writer = None
+        self._rate = 22050
+        self._device = None
+
+        # The (number, kwargs) of the texts queued after the one playing,
+        # and the (number, fileobj) of the next one, which is synthesised
+        # while the current one plays.
+        self._queue = deque()
+        self._next = None
+
+        # The text being played.
+        self._fileobj = None
+
+    def __repr__(self) -> str:
+        """ __repr__ -> Returns a python expression to recreate this instance.
+
+        """
+
+        repr_str = "idle_timeout=%s" % self._idle_timeout
+
+        return '%s(%s)' % (self.__class__.__name__, repr_str)
+
+    def _open_device(self):
+        """ Open the audio device if it is closed.
+
+        """
+
+        if not self._device or self._device.closed:
+            if self._ring is not None:
+                self._device = RingDevice(self._ring)
+            else:
+                self._device = open_sink(self._sink, self._rate)
+
+    def _close_device(self, force: bool=False):
+        """ Close the audio device so other processes can use it.  Sinks
+        that are not devices, like files, are only closed if force is
+        True.
+
+        """
+
+        if self._device and not self._device.closed:
+            if force or self._device.exclusive:
+                self._device.close()
+
+    def _pending(self) -> int:
+        """ Returns the number of bytes read that have not been written to
+        the device, or played by the output process.
+
+        """
+
+        pending = self._writer.pending if self._writer else 0
+        if self._ring is not None:
+            pending += self._ring.available
+
+        return pending
+
+    def _flush(self):
+        """ Drop the audio the device, or the output process, has not been
+        given.
+
+        """
+
+        if self._writer:
+            self._writer.flush()
+        if self._ring is not None:
+            self._ring.flush()
+
+    def _prepare(self):
+        """ Start synthesising the next queued text if it is not already.
+
+        """
+
+        if self._next is None and self._queue:
+            number, kwargs = self._queue.popleft()
+            self._next = (number, EspeakText(**kwargs))
+
+    def _advance(self):
+        """ Returns the next text, or None if nothing is queued, and starts
+        synthesising the one after it.
+
+        """
+
+        self._prepare()
+        if self._next is None:
+            return None
+
+        number, fileobj = self._next
+        self._next = None
+        self._state.item.value = number
+
+        self._prepare()
+
+        return fileobj
+
+    def _switch(self, fileobj):
+        """ Close the text being played and play fileobj instead.
+
+        """
+
+        if self._fileobj is not None:
+            self._fileobj.close()
+        self._fileobj = fileobj
+
+        # Share the cache counters between texts rather than after every
+        # buffer, the caches may be busy writing to disk during synthesis.
+        self._state.update_caches()
+
+    def _watch_stop(self, done: Pipe):
+        """ Cancel synthesis and drop the audio that has not been played as
+        soon as the parent stops playback, instead of when the player next
+        checks, which could be after a long wait for synthesis or the
+        device.  Returns once something is sent on done.
+
+        """
+
+        state = self._state
+
+        # Pipes rather than events, an event is left broken if the
+        # process is killed while waiting on it.
+        while True:
+            ready = connection_wait([self._stop_pipe, done])
+            if done in ready:
+                break
+
+            self._stop_pipe.recv()
+            if not state.playing.is_set():
+                # espeak is told to cancel and the synth callback returns 1,
+                # so a read waiting for synthesis returns right away.
+                fileobj = self._fileobj
+                if fileobj is not None:
+                    fileobj.cancel()
+
+                # The next text is being synthesised too, and closing the
+                # current one waits for the engine to get to it.
+                following = self._next
+                if following is not None:
+                    following[1].cancel()
+
+                if self._writer:
+                    self._writer.drop()
+
+                # The writer may be waiting for room in a full ring, so let
+                # the output process skip what is in it instead of playing
+                # it first.
+                if self._ring is not None:
+                    self._ring.flush()
+                break
+
+            # Anything else was left from stopping an earlier text.
+
+    def _clear(self):
+        """ Drop the queued texts.
+
+        """
+
+        self._queue.clear()
+        if self._next is not None:
+            self._next[1].close()
+            self._next = None
+
+    def run(self):
+        """ Play each text sent until told to quit.
+
+        """
+
+        # Get espeak and the device ready before the first text.
+        self._rate = get_engine().rate
+        self._state.rate.value = self._rate
+        self._open_device()
+
+        try:
+            while True:
+                # Wait for a command, closing the device if none comes
+                # for a while.
+                timeout = None
+                if self._device.exclusive and not self._device.closed:
+                    timeout = self._idle_timeout
+
+                if not self._pipe.poll(timeout):
+                    self._close_device()
+                    continue
+
+                command = self._pipe.recv()
+
+                if command == 'quit':
+                    break
+                elif 'play' in command:
+                    self._play(command['play'])
+                elif 'enqueue' in command:
+                    # The last text ended before this arrived, so play it
+                    # now.
+                    self._state.playing.set()
+                    self._state.idle.clear()
+                    self._play(command['enqueue'])
+
+                # Anything else was meant for a text that has finished.
+        finally:
+            self._close_device(force=True)
+
+            if self._ring is not None:
+                self._ring.release()
+
+    def _play(self, item: tuple):
+        """ Play item, a (number, kwargs) tuple, the text EspeakText(**kwargs)
+        makes, and then each text queued after it until they end or are
+        stopped.  The device is fed without a break from one text to the
+        next.
+
+        """
+
+        state = self._state
+        pipe = self._pipe
+
+        watcher = None
+        if self._stop_pipe is not None:
+            done, finished = Pipe(duplex=False)
+            watcher = Thread(target=self._watch_stop, args=(done,),
+                             daemon=True)
+            watcher.start()
+
+        try:
+            # Open the file to play.
+            self._queue.appendleft(item)
+            self._switch(self._advance())
+            fileobj = self._fileobj
+
+            state.update(fileobj)
+
+            self._open_device()
+
+            # The buffers are allocated once for all the texts.
+            writer = BufferWriter(state, self._device.buffer_size,
+                                  self._prefetch)
+            self._writer = writer
+
+            count = 1
+
+            # Time the first buffer of the text like a resume.
+            resuming = True
+
+            # Loop until stopped or nothing is read.
+            while state.playing.is_set() and count:
+                # Keep playing if not paused.
+                if not state.paused.is_set():
+                    # Re-open the device if it was closed.
+                    if not writer.running:
+                        self._open_device()
+                        writer.start(self._device)
+
+                    # Read the next buffer full of data.
+                    buf = writer.get_buffer()
+                    count = fileobj.readinto(buf)
+
+                    # Fill the rest of the buffer from the next text so
+                    # its audio follows straight on.
+                    while count < len(buf) and state.playing.is_set():
+                        next_fileobj = self._advance()
+                        if next_fileobj is None:
+                            break
+
+                        self._switch(next_fileobj)
+                        fileobj = next_fileobj
+                        count += fileobj.readinto(memoryview(buf)[count:])
+
+                    if resuming:
+                        resuming = False
+                        latency = monotonic() - state.resumed_at.value
+                        state.resume_latency.value = latency
+
+                    # Have the writer thread write what was read.
+                    writer.put(buf, count)
+
+                    state.update(fileobj, self._pending())
+                else:
+                    # Close the device when paused to open the audio
+                    # for another process.  Audio that has not been
+                    # played is dropped, so go back to it.
+                    pending = self._pending()
+                    writer.stop()
+                    self._close_device()
+                    if pending:
+                        position = max(fileobj.position - pending, 0)
+                        fileobj.position = position
+
+                    # Block until the parent sends a command, it sends
+                    # one whenever it resumes or stops playback, so a
+                    # paused player uses no cpu.
+                    pipe.poll(None)
+                    state.wakeups.value += 1
+                    resuming = True
+
+                # Get and process any commands from the parent process.
+                if pipe.poll():
+                    # Get the data into temp.
+                    command = pipe.recv()
+
+                    if command not in ('wake', 'clear') and \
+                            'enqueue' not in command:
+                        # Drop the audio from before the seek.
+                        self._flush()
+
+                    if 'enqueue' in command:
+                        self._queue.append(command['enqueue'])
+                        self._prepare()
+                    elif command == 'clear':
+                        self._clear()
+                    elif command == 'skip':
+                        next_fileobj = self._advance()
+                        if next_fileobj is None:
+                            # Nothing left to play.
+                            count = 0
+                        else:
+                            self._switch(next_fileobj)
+                            fileobj = next_fileobj
+                    elif 'setposition' in command:
+                        fileobj.position = command['setposition']
+                    elif 'seek_word' in command:
+                        fileobj.seek_word(command['seek_word'])
+                    elif 'seek_sentence' in command:
+                        fileobj.seek_sentence(command['seek_sentence'])
+                    elif 'seek_text_offset' in command:
+                        offset = command['seek_text_offset']
+                        fileobj.seek_text_offset(offset)
+
+                    state.update(fileobj, self._pending())
+
+            if state.playing.is_set():
+                # Play the rest.
+                writer.finish()
+            else:
+                # Stop the rest from being played when stopped.
+                self._flush()
+                writer.stop()
+        except Exception as err:
+            print(err)
+        finally:
+            if self._writer:
+                self._writer.stop()
+                self._writer = None
+
+            # Cancel the queued text first, closing the current one waits
+            # for the engine, which may be synthesising the queued one.
+            self._clear()
+            self._switch(None)
+
+            if watcher is not None:
+                finished.send(None)
+                watcher.join()
+                done.close()
+                finished.close()
+
+            if not state.playing.is_set():
+                latency = monotonic() - state.stopped_at.value
+                state.stop_latency.value = latency
+
+            # Set playing to False for the parent, before idle so a new
+            # text is not marked stopped.
+            state.playing.clear()
+            state.idle.set()
 
 
 class Reader(object):
@@ -38,38 +825,54 @@ class Reader(object):
 
     """
 
-    def __init__(self):
-        """ Player(text, **kwargs) -> Speak text.
+    def __init__(self, output_process: bool=False, sink: str='alsa'):
+        """ Reader(output_process=False, sink='alsa') -> Speak text to the
+        sink named by sink, one of 'alsa', 'null', 'wav:path' or
+        'pipe:path'.  If output_process is True synthesis and the sink run
+        in separate processes that share the audio through a ring buffer.
 
         """
 
+        # Check the sink name now rather than in the player.
+        get_sink_class(sink)
+
         self._text = ''
+        self._kwargs = {}
+
+        # The (number, text) of the texts queued after the one playing.
+        self._queue = []
+        self._item_count = 0
+
+        self._sink = sink
+        self._output_process = output_process
+        self._ring = None
+        self._output = None
 
-        # Setup the msg_dict for sending messages to the child process.
-        self._msg_dict = Manager().dict()
+        # The state shared with the player process.
+        self._state = PlayerState()
 
-        # Create a pipe for sending and receiving messages.
-        self._control_conn, self._player_conn = Pipe()
+        self._lock = RLock()
+        self._worker = None
+        self._restarts = 0
+        self._closing = False
+
+        # Start the player now so it is ready for the first text.
+        self._start_worker()
 
     def __str__(self) -> str:
         """ The information about the open file.
 
         """
 
-        return self._text
-
-        # Wait for the stream to open.
-        while 'info' not in self._msg_dict: pass
-
-        # Return the info string.
-        return self._msg_dict.get('info', '')
+        return str(self._text)
 
     def __repr__(self) -> str:
         """ __repr__ -> Returns a python expression to recreate this instance.
 
         """
 
-        repr_str = ''  # "filename='%(_filename)s'" % self.__dict__
+        repr_str = "output_process=%s, sink=%r" % (self._output_process,
+                                                   self._sink)
 
         return '%s(%s)' % (self.__class__.__name__, repr_str)
 
@@ -90,9 +893,7 @@ class Reader(object):
         """
 
         try:
-            self.stop()
-            self._control_conn.close()
-            self._player_conn.close()
+            self.close()
             return not bool(exc_type)
         except Exception as err:
             print(err)
@@ -125,91 +926,133 @@ class Reader(object):
             """
 
             if not self.playing:
-                print("%(filename)s is not playing." % self._msg_dict)
+                print("Nothing is playing.")
                 return None
 
             return func(self, *args, **kwargs)
 
         return wrapper
 
-    def _play_proc(self, msg_dict: dict, pipe: Pipe):
-        """ Player process
+    def _start_worker(self):
+        """ Start the player process and a thread that restarts it if it
+        dies.
+
+        """
+
+        with self._lock:
+            # Create a pipe for sending and receiving messages.
+            self._control_conn, self._player_conn = Pipe()
+
+            # Stops go on their own pipe so the player sees them while it
+            # is busy.
+            self._stop_recv, self._stop_send = Pipe(duplex=False)
+
+            self._state.playing.clear()
+            self._state.paused.clear()
+            self._state.idle.set()
+
+            # A new player has nothing queued.
+            self._queue = []
+
+            if self._output_process:
+                self._ring = RingBuffer()
+                output = OutputWorker(self._ring, self._state,
+                                      sink=self._sink)
+                self._output = Process(target=output.run, daemon=True)
+                self._output.start()
+
+            worker = PlayerWorker(self._state, self._player_conn,
+                                  ring=self._ring, sink=self._sink,
+                                  stop_pipe=self._stop_recv)
+            self._worker = Process(target=worker.run, daemon=True)
+            self._worker.start()
+
+            Thread(target=self._watch, args=(self._worker, self._output),
+                   daemon=True).start()
+
+    def _watch(self, worker: Process, output: Process):
+        """ Wait for the player process worker, or the output process
+        output, to exit and start new ones unless the reader is closing.
 
         """
 
-        # Open the file to play.
-        with EspeakText(**msg_dict) as fileobj:
+        processes = [proc for proc in (worker, output) if proc]
+        connection_wait([proc.sentinel for proc in processes])
+
+        with self._lock:
+            if self._closing or worker is not self._worker:
+                return
+
+            # One can not run without the other.
+            for proc in processes:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join()
+
+            print("The player exited with %s, restarting it." %
+                  [proc.exitcode for proc in processes], file=sys_stderr)
 
-            # Put the file info in msg_dict.
-            # msg_dict['info'] = str(fileobj)
-            msg_dict['length'] = fileobj.length
+            self._close_pipes()
+            if self._ring is not None:
+                self._ring.unlink()
 
-            # Open an audio output device that can handle the data from
-            # fileobj.
-            # with AudioDevice(rate=22050, channels=1) as device:
+            self._restarts += 1
+            self._start_worker()
 
-            device = AudioDevice(rate=22050, channels=1)
+    def _close_pipes(self):
+        """ Close the pipes to the player process.
+
+        """
+
+        for conn in (self._control_conn, self._player_conn,
+                     self._stop_recv, self._stop_send):
+            conn.close()
+
+    def _send(self, command):
+        """ Send command to the player process.
+
+        """
+
+        with self._lock:
             try:
+                self._control_conn.send(command)
+            except OSError as err:
+                # The watcher restarts a dead player.
+                print(err, file=sys_stderr)
 
-                # Set the default number of loops to infinite.
-                fileobj.loops = msg_dict.get('loops', -1)
-
-                # Initialize variable.
-                buf = b'\x00' * device.buffer_size
-                written = 0
-
-                # Loop until stopped or nothing read or written.
-                while msg_dict['playing'] and (buf or written):
-                    # Keep playing if not paused.
-                    if not msg_dict.get('paused', False):
-                        # Re-open the device if it was closed.
-                        if device.closed:
-                            device = AudioDevice(rate=22050, channels=1)
-
-                        # Read the next buffer full of data.
-                        buf = fileobj.readline()
-
-                        # Write buf.
-                        written = device.write(buf)
-                    else:
-                        # Close the device when paused and sleep to
-                        # open the audio for another process and
-                        # save cpu cycles.
-                        if not device.closed:
-                            device.close()
-
-                        time_sleep(0.05)
-
-                        # Write a buffer of null bytes so the audio
-                        # system can keep its buffer full.
-                        # device.write(b'\x00' * device.buffer_size)
-
-                    # Get and process any commands from the parent process.
-                    if pipe.poll():
-                        # Get the data into temp.
-                        command = pipe.recv()
-
-                        if 'getposition' in command:
-                            pipe.send(fileobj.position)
-                        elif 'setposition' in command:
-                            fileobj.position = command['setposition']
-            except Exception as err:
-                print(err)
-            finally:
-                if not device.closed:
-                    device.close()
+    def close(self):
+        """ close() -> Stop playback and shut down the player process.
+
+        """
+
+        if self._closing:
+            return
 
-        # Set playing to False for the parent.
-        msg_dict['playing'] = False
+        self.stop()
+
+        with self._lock:
+            self._closing = True
+            self._send('quit')
+
+        self._worker.join()
+        self._close_pipes()
 
-    def read(self, text: str, **kwargs):
-        """ Read the text.
+        if self._ring is not None:
+            self._ring.close()
+            self._output.join()
+            self._ring.unlink()
+
+    def read(self, text, **kwargs):
+        """ Read the text, a str or a Document, which the player maps again
+        instead of being sent the text.  The keyword arguments are passed on
+        to EspeakText, for example start=offset begins reading at the
+        sentence at character offset without synthesising the text before
+        it.
 
         """
 
         self._text = text
-        self._msg_dict['text'] = text
-        self._msg_dict.update(kwargs)
+        self._kwargs = kwargs
 
         # After opening a new file stop the current one from playing.
         self.stop()
@@ -220,39 +1063,130 @@ class Reader(object):
         # Start it playing so seeking works.
         self.play()
 
+    def _new_item(self, text, kwargs: dict) -> tuple:
+        """ Returns a (number, kwargs) tuple for the player to play text
+        with.
+
+        """
+
+        self._item_count += 1
+
+        return self._item_count, dict(kwargs, text=text)
+
+    def enqueue(self, text, **kwargs) -> int:
+        """ enqueue(text, **kwargs) -> Play text after the texts already
+        queued, or now if nothing is playing.  It is synthesised while the
+        text before it plays, and follows it without a gap.  The keyword
+        arguments are the same as for read.  Returns the queue length.
+
+        """
+
+        with self._lock:
+            if not self._state.playing.is_set():
+                self._text = text
+                self._kwargs = kwargs
+                self.play()
+                return 0
+
+            number, item_kwargs = self._new_item(text, kwargs)
+            self._queue.append((number, text))
+            self._send({'enqueue': (number, item_kwargs)})
+
+            return len(self.queue)
+
+    def skip(self):
+        """ skip() -> Stop the current text and play the next queued one.
+
+        """
+
+        if self._state.playing.is_set():
+            self._send('skip')
+
+    def clear(self):
+        """ clear() -> Drop the queued texts, the current one keeps
+        playing.
+
+        """
+
+        with self._lock:
+            self._queue = []
+            if self._state.playing.is_set():
+                self._send('clear')
+
+    @property
+    def queue(self) -> list:
+        """ The texts queued after the one playing.
+
+        """
+
+        with self._lock:
+            # Forget the ones the player has started.
+            current = self._state.item.value
+            self._queue = [(number, text) for number, text in self._queue
+                           if number > current]
+
+            return [text for _, text in self._queue]
+
     def play(self):
         """ play() -> Start playback.
 
         """
 
-        if not self._msg_dict.get('playing', False):
-            # Set playing to True for the child process.
-            self._msg_dict['playing'] = True
+        if not self._state.playing.is_set():
+            # The last text may still be stopping.
+            self._state.idle.wait()
 
-            # Open a new process to play a file in the background.
-            self._play_p = Process(target=self._play_proc,
-                                   args=(self._msg_dict, self._player_conn))
+            # Set playing to True for the player process.
+            self._state.resumed_at.value = monotonic()
+            self._state.playing.set()
+            self._state.idle.clear()
 
-            # Start the process.
-            self._play_p.start()
-        elif self._msg_dict.get('paused', True):
+            # Have the player process play the text in the background.
+            self._send({'play': self._new_item(self._text, self._kwargs)})
+        elif self._state.paused.is_set():
             # Un-pause if paused.
-            self._msg_dict['paused'] = False
+            self._state.resumed_at.value = monotonic()
+            self._state.paused.clear()
 
-    def stop(self):
-        """ stop() -> Stop playback.
+            # Wake up the player.
+            self._send('wake')
+
+    def stop(self, wait: bool=True):
+        """ stop(wait=True) -> Stop playback and drop the queued texts.
+        Synthesis is cancelled and the audio that has not been played is
+        dropped right away.  If wait is False this returns without waiting
+        for the player to finish, so it does not hold up a gui.
 
         """
 
-        if self._msg_dict.get('playing', False):
-            # Stop playback.
-            self._msg_dict['playing'] = False
+        with self._lock:
+            self._queue = []
 
-            # Wait for the player process to stop.
-            self._play_p.join()
+        if self._state.playing.is_set():
+            # Stop playback and wake up the player if it is paused.
+            self._state.stopped_at.value = monotonic()
+            self._state.playing.clear()
+            with self._lock:
+                try:
+                    self._stop_send.send(None)
+                except OSError as err:
+                    print(err, file=sys_stderr)
+            self._send('wake')
+
+            # Wait for the player process to finish with the text.
+            if wait:
+                self._state.idle.wait()
 
             # Un-Pause.
-            self._msg_dict['paused'] = False
+            self._state.paused.clear()
+
+    def wait(self, timeout: float=None) -> bool:
+        """ wait(timeout=None) -> Wait up to timeout seconds for the text
+        to finish playing and return True if it did.
+
+        """
+
+        return self._state.idle.wait(timeout)
 
     def pause(self):
         """ pause() -> Pause playback.
@@ -260,7 +1194,30 @@ class Reader(object):
         """
 
         # Pause playback.
-        self._msg_dict['paused'] = True
+        self._state.paused.set()
+
+    def stats(self) -> dict:
+        """ stats() -> Returns how often the paused player woke up, how
+        long, in seconds, the last resume took to have audio to write and
+        the last stop took to finish, how often the player process was
+        restarted, how often the device had to wait for audio, how many
+        buffers were ready for it, and the hit, miss, eviction and size
+        counters of the player's text and phrase caches.
+
+        """
+
+        caches = self._state.caches()
+
+        return {
+            'wakeups': self._state.wakeups.value,
+            'resume_latency': self._state.resume_latency.value,
+            'stop_latency': self._state.stop_latency.value,
+            'restarts': self._restarts,
+            'underruns': self._state.underruns.value,
+            'prefetch_depth': self._state.prefetch_depth.value,
+            'text_cache': caches['text'],
+            'phrase_cache': caches['phrase'],
+        }
 
     @property
     def paused(self) -> bool:
@@ -268,7 +1225,7 @@ class Reader(object):
 
         """
 
-        return self._msg_dict.get('paused', False)
+        return self._state.paused.is_set()
 
     @property
     def playing(self) -> bool:
@@ -276,7 +1233,7 @@ class Reader(object):
 
         """
 
-        return self._msg_dict.get('playing', False)
+        return self._state.playing.is_set()
 
     @property
     def length(self) -> int:
@@ -284,7 +1241,15 @@ class Reader(object):
 
         """
 
-        return self._msg_dict.get('length', 0)
+        return self._state.length.value
+
+    @property
+    def rate(self) -> int:
+        """ Sample rate of the audio.
+
+        """
+
+        return self._state.rate.value
 
     @property
     @playing_wrapper
@@ -293,8 +1258,7 @@ class Reader(object):
 
         """
 
-        self._control_conn.send('getposition')
-        return self._control_conn.recv()
+        return self._state.position.value
 
     @position.setter
     @playing_wrapper
@@ -303,7 +1267,69 @@ class Reader(object):
 
         """
 
-        self._control_conn.send({'setposition': int(value)})
+        self._send({'setposition': int(value)})
+
+    @property
+    @playing_wrapper
+    def location(self) -> tuple:
+        """ The current (position, word, sentence).  Sentences are numbered
+        from the start of the text.  Words are numbered from where synthesis
+        last started, the start of the text or the sentence of a seek that
+        had to synthesise the text again, since the words before it are not
+        known.
+
+        """
+
+        return (self._state.position.value, self._state.word.value,
+                self._state.sentence.value)
+
+    @property
+    def word(self) -> int:
+        """ The number of the word being spoken, counting from where
+        synthesis last started, see location.
+
+        """
+
+        location = self.location
+        return location[1] if location else -1
+
+    @property
+    def sentence(self) -> int:
+        """ The number of the sentence being spoken, or -1 while the player
+        is still numbering the sentences before it after a seek into a long
+        text.
+
+        """
+
+        location = self.location
+        return location[2] if location else -1
+
+    @playing_wrapper
+    def seek_word(self, number: int):
+        """ seek_word(number) -> Continue from the start of word number,
+        counting from where synthesis last started, see location.
+
+        """
+
+        self._send({'seek_word': int(number)})
+
+    @playing_wrapper
+    def seek_sentence(self, number: int):
+        """ seek_sentence(number) -> Continue from the start of sentence
+        number.
+
+        """
+
+        self._send({'seek_sentence': int(number)})
+
+    @playing_wrapper
+    def seek_text_offset(self, offset: int):
+        """ seek_text_offset(offset) -> Continue from the start of the word
+        at character offset in the text.
+
+        """
+
+        self._send({'seek_text_offset': int(offset)})
 
     @playing_wrapper
     def tell(self) -> int:
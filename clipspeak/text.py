@@ -23,47 +23,198 @@
 
 """
 
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from sys import maxsize as sys_maxsize
 import re
 
+from .abbreviations import get_abbreviations, is_abbreviation
+from .document import Document
 
-class Text(object):
-    """ Wrap text file objects.
+# Closing quotes and brackets that belong to the sentence before them.
+_CLOSERS = '"\')]}\u00bb\u201d\u2019'
+
+
+def _split_long(text: str, offset: int, max_length: int):
+    """ Generate (offset, piece) for pieces of text, which starts at offset,
+    of at most max_length characters ending at a line break or space if
+    there is one, and return what is left over, which is no longer than
+    max_length.
 
     """
 
-    def __init__(self, text: str, sentence_endings: str='.!?'):
-        """ Text(text) -> Just a regular file object.
+    start = 0
+    while len(text) - start > max_length:
+        end = start + max_length
+        cut = (text.rfind('\n', start, end) + 1 or
+               text.rfind(' ', start, end) + 1 or end)
+        yield offset + start, text[start:cut]
+        start = cut
+
+    return text[start:]
 
-        """
 
-        self._text = text.encode()
+def _coalesce(chunks, size: int=8192):
+    """ Generate the str chunks joined into chunks of at least size
+    characters, except the last.
 
-        # Only read one line/sentence at a time.
-        self._buffer_size = 1
+    """
 
-        # Regex to match sentences.
-        sentence_endings = '.*?[%s]' % re.escape(sentence_endings)
-        re_flags = re.DOTALL | re.IGNORECASE | re.MULTILINE
+    parts = []
+    length = 0
 
-        # Compile the sentence regex.
-        sentence_regex = re.compile(sentence_endings.encode(), re_flags)
+    for chunk in chunks:
+        parts.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(parts)
+            parts = []
+            length = 0
 
-        # List of sentences in file
-        sentence_list = sentence_regex.findall(self._text)
+    if parts:
+        yield ''.join(parts)
 
-        # Check for sentence endings.
-        if sentence_list:
-            self._line_list = [sentence.decode() for sentence in sentence_list]
-        elif self._text:
-            self._line_list = self._text.decode().splitlines()
-        else:
-            self._line_list = []
 
-        if self._line_list:
-            # The length is the length of the line list.
-            self._length = len(self._line_list)
+def split_sentences(source, sentence_endings: str='.!?',
+                    max_length: int=1000, language: str='en'):
+    """ split_sentences(source, sentence_endings='.!?', max_length=1000,
+    language='en') -> Generate (offset, sentence) for each sentence in
+    source, a str or an iterable of str chunks like a file opened in text
+    mode, where offset is the character offset of the sentence.
+
+    A sentence runs up to and including a run of the characters in
+    sentence_endings, and any closing quotes or brackets, that is followed
+    by a space or the end of the text.  So periods inside numbers,
+    addresses and file names do not end one, and neither do those after the
+    abbreviations of language.  The text after the last sentence is kept.
+
+    Sentences are yielded as soon as their end is scanned, in one pass over
+    the text.  Text without any endings is split into lines, and sentences
+    longer than max_length are split at line breaks or spaces, so no more
+    than that is held at a time.  A long run of endings without a space
+    after it takes linear time too:
+
+    >>> [len(line) for _, line in split_sentences('.' * 10000 + 'x')][-2:]
+    [1000, 1]
+
+    """
+
+    # Endings with any closing quotes or brackets, followed by a space or
+    # the end of the text.  A match can not start inside a run of endings,
+    # or a long run that is not followed by a space is tried from every
+    # character in it.
+    endings = re.escape(sentence_endings)
+    ending = re.compile('(?<![%s])([%s]+)[%s]*(?=\\s|\\Z)' % (
+                        endings, endings, re.escape(_CLOSERS)))
+    abbreviations = get_abbreviations(language)
+
+    if isinstance(source, str):
+        source = (source,)
+    chunks = _coalesce(source)
+
+    # The offset of text, which holds the sentence being scanned and the
+    # rest of the chunk, and where in it to look for the next ending.
+    offset = 0
+    text = ''
+    scan = 0
+    ended = False
+
+    chunk = next(chunks, None)
+    while chunk is not None:
+        # Get the next chunk now to know if this is the last.
+        following = next(chunks, None)
+        text += chunk
+
+        start = 0
+        while True:
+            match = ending.search(text, scan)
+            if match is None:
+                scan = len(text)
+                break
+
+            end = match.end()
+            if end == len(text) and following is not None:
+                # What comes after it is in the next chunk.
+                scan = match.start()
+                break
+
+            scan = end
+            if match.group(1) == '.' and is_abbreviation(text,
+                                                         match.start(),
+                                                         abbreviations):
+                continue
+
+            sentence = text[start:end]
+            if len(sentence) > max_length:
+                sentence = yield from _split_long(sentence, offset + start,
+                                                  max_length)
+            yield offset + end - len(sentence), sentence
+
+            start = end
+            ended = True
+
+        # Drop the sentences that are done.
+        text = text[start:]
+        offset += start
+        scan -= start
+
+        if len(text) > max_length:
+            # Too long to be a sentence, so give up waiting for its end.
+            rest = yield from _split_long(text, offset, max_length)
+            offset += len(text) - len(rest)
+            scan = max(scan - (len(text) - len(rest)), 0)
+            text = rest
+
+        chunk = following
+
+    if ended:
+        # Keep the text after the last sentence.
+        if text.strip():
+            yield offset, text
+    else:
+        # Without sentences read it a line at a time.
+        for line in text.splitlines(True):
+            yield offset, line
+            offset += len(line)
+
+
+class Text(object):
+    """ Wrap text file objects.  The sentences are kept as a table of their
+    start and end offsets into the text, so any sentence can be had by
+    number or by a character offset in it.
+
+    """
+
+    def __init__(self, text, sentence_endings: str='.!?',
+                 language: str='en'):
+        """ Text(text, sentence_endings='.!?', language='en') -> Just a
+        regular file object.  text is a str, a Document, or an iterable of
+        str chunks, like a file, which is only read as far as the sentences
+        are.  Periods after the abbreviations of language do not end
+        sentences.
+
+        """
+
+        if isinstance(text, (str, Document)):
+            # The sentences are sliced out of it, a document only decodes
+            # the part that holds them.
+            self._text = text
+            self._chunks = None
         else:
-            self._length = len(self._text)
+            # Keep what is read to slice the sentences from.
+            self._text = ''
+            self._chunks = []
+            text = self._read(text)
+
+        # The sentences are split off as they are needed.
+        self._spans = split_sentences(text, sentence_endings,
+                                      language=language)
+        self._scanned = False
+
+        # The start and end offsets of the sentences split off so far.
+        self._starts = array('I')
+        self._ends = array('I')
 
         # Current index.
         self._index = 0
@@ -73,33 +224,134 @@ class Text(object):
 
         """
 
-        repr_str = "text='%(_text)s'" % self
+        repr_str = "text=%r" % self._text
 
         return '%s(%s)' % (self.__class__.__name__, repr_str)
 
-    def readlines(self, count=-1) -> str:
-        """ readlines(count=-1) -> Returns count lines/sentences if it can.
+    def __len__(self) -> int:
+        """ The number of lines/sentences.
+
+        """
+
+        self._scan_to(sys_maxsize)
+
+        return len(self._starts)
+
+    def __getitem__(self, number: int) -> str:
+        """ Returns line/sentence number.
 
         """
 
-        # Start index.
-        slice_start = self._index
+        start, end = self.span(number)
 
-        # Return all the lines if count is -1.
-        if count == -1:
-            self._index = self._length
-            return self._lines[slice_start:]
+        return self._get_text(end)[start:end]
 
-        # Calculate the last index to read to.
-        slice_end = slice_start + count
+    def __iter__(self):
+        """ Iterate over the remaining lines/sentences.
+
+        """
+
+        for _, line in self.spans():
+            yield line
+
+    def _read(self, chunks):
+        """ Generate the chunks of text, keeping them.
+
+        """
 
-        # Read count number of sentences if available.
-        lines = ' '.join(self._line_list[slice_start:slice_end])
+        for chunk in chunks:
+            self._chunks.append(chunk)
+            yield chunk
+
+    def _get_text(self, end: int) -> str:
+        """ Returns the text, at least up to offset end if it was read.
+
+        """
+
+        if self._chunks and len(self._text) < end:
+            self._text = ''.join(self._chunks)
+            self._chunks[:] = [self._text]
+
+        return self._text
+
+    def _next_span(self) -> tuple:
+        """ Split off the next line/sentence and return its (offset, line), or
+        None if there are no more.
+
+        """
+
+        span = next(self._spans, None)
+        if span is None:
+            self._scanned = True
+        else:
+            offset, line = span
+            self._starts.append(offset)
+            self._ends.append(offset + len(line))
+
+        return span
+
+    def _scan_to(self, offset: int):
+        """ Split off sentences until the one that contains offset.
+
+        """
+
+        while not self._scanned and (not self._ends or
+                                     self._ends[-1] <= offset):
+            self._next_span()
+
+    def span(self, number: int) -> tuple:
+        """ span(number) -> Returns the (start, end) offsets of line/sentence
+        number.
+
+        """
+
+        if number < 0:
+            number += len(self)
+
+        while number >= len(self._starts) and not self._scanned:
+            self._next_span()
+
+        return self._starts[number], self._ends[number]
+
+    def sentence_at(self, offset: int) -> int:
+        """ sentence_at(offset) -> Returns the number of the line/sentence
+        that contains character offset, or -1 if it is before the first one.
+
+        """
+
+        self._scan_to(offset)
+
+        return bisect_right(self._starts, offset) - 1
+
+    def spans(self):
+        """ Iterate over (offset, line) for the remaining lines/sentences,
+        where offset is the character offset of the line in the text.
+
+        """
+
+        while True:
+            if self._index < len(self._starts):
+                # It was split off already.
+                offset = self._starts[self._index]
+                line = self[self._index]
+            else:
+                span = self._next_span()
+                if span is None:
+                    break
+                offset, line = span
+
+            self._index += 1
+            yield offset, line.replace('\n', ' ')
+
+    def readlines(self, count=-1) -> str:
+        """ readlines(count=-1) -> Returns count lines/sentences if it can.
+
+        """
 
-        # Increment the sentence index.
-        self._index += count % ((self._length - slice_start) + count)
+        # Read all the lines if count is -1.
+        stop = None if count < 0 else count
 
-        return lines.replace('\n', ' ')
+        return ' '.join(line for line in islice(self, stop))
 
     def read(self, size: int) -> str:
         """ Return size or less ammount of text.